@@ -1,17 +1,47 @@
 __version__ = "4.0.0"
 
-import concurrent.futures
-
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+# The downloader, the providers and the console are imported when they are
+# first used, so importing the package (or the console entry point) is fast
+# pylint: disable=import-outside-toplevel
+if TYPE_CHECKING:
+    from spotdl.download.progress_handlers.base import ProgressHandler
+    from spotdl.types import Song
+
+
+# Names exported by the package, they are imported on first access
+_LAZY_EXPORTS = {
+    "AUDIO_PROVIDERS": "spotdl.download.downloader:AUDIO_PROVIDERS",
+    "DownloaderError": "spotdl.download.downloader:DownloaderError",
+    "Downloader": "spotdl.download.downloader:Downloader",
+    "ProgressHandler": "spotdl.download.progress_handlers.base:ProgressHandler",
+    "SpotifyClient": "spotdl.utils.spotify:SpotifyClient",
+    "console_entry_point": "spotdl.console.entry_point:console_entry_point",
+    "parse_query": "spotdl.utils.query:parse_query",
+    "Song": "spotdl.types:Song",
+}
+
+__all__ = ["Spotdl", *_LAZY_EXPORTS]
+
 
-from spotdl.download.downloader import AUDIO_PROVIDERS, DownloaderError
-from spotdl.download.progress_handlers.base import ProgressHandler
-from spotdl.utils.spotify import SpotifyClient
-from spotdl.console import console_entry_point
-from spotdl.utils.query import parse_query
-from spotdl.download import Downloader
-from spotdl.types import Song
+def __getattr__(name: str) -> Any:
+    """
+    Import the exported names on first access.
+    """
+
+    spec = _LAZY_EXPORTS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module_name, attr_name = spec.split(":")
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+
+    return value
 
 
 class Spotdl:
@@ -33,8 +63,11 @@ class Spotdl:
         m3u_file: Optional[str] = None,
         overwrite: str = "overwrite",
         browsers: Optional[Tuple] = None,
-        progress_handler: Optional[ProgressHandler] = None,
+        progress_handler: Optional["ProgressHandler"] = None,
     ):
+        from spotdl.utils.spotify import SpotifyClient
+        from spotdl.download.downloader import Downloader
+
         # Initialize spotify client
         SpotifyClient.init(
             client_id=client_id, client_secret=client_secret, user_auth=user_auth
@@ -60,51 +93,58 @@ class Spotdl:
 
         self.audio_provider = audio_provider
 
-    def get_download_urls(self, songs: List[Song]) -> List[Optional[str]]:
+    def get_download_urls(self, songs: List["Song"]) -> List[Optional[str]]:
         """
-        Search .
+        Search for download urls of the songs.
+        Searches are run concurrently and cached between runs.
         """
 
+        from spotdl.utils.query import deduplicate_songs
+
+        unique_songs = deduplicate_songs(songs)
+        progress_handler = self.downloader.progress_handler
+        if progress_handler and len(unique_songs) != len(songs):
+            progress_handler.debug(
+                "Skipping %d duplicate songs", len(songs) - len(unique_songs)
+            )
+
+        songs = unique_songs
+        results = self.downloader.search_songs(songs)
+
         urls = []
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.downloader.threads
-        ) as executor:
-            future_to_song = {
-                executor.submit(self.downloader.audio_provider.search, song): song
-                for song in songs
-            }
-            for future in concurrent.futures.as_completed(future_to_song):
-                song = future_to_song[future]
-                try:
-                    data = future.result()
-                    urls.append(data)
-                except Exception as exc:  # pylint: disable=W0703
-                    print(f"{song} generated an exception: {exc}")
+        for song, data in results:
+            if isinstance(data, Exception):
+                print(f"{song} generated an exception: {data}")
+                continue
+
+            urls.append(data)
 
         return urls
 
-    def parse_query(self, query: List[str]) -> List[Song]:
+    def parse_query(self, query: List[str]) -> List["Song"]:
         """
         Parse a list of queries and return a list of Song objects.
         """
 
+        from spotdl.utils.query import parse_query
+
         return parse_query(query, self.downloader.threads)
 
-    def download(self, song: Song) -> None:
+    def download(self, song: "Song") -> None:
         """
         Download and convert song to the output format.
         """
 
         self.downloader.download_song(song)
 
-    async def download_no_convert(self, song: Song) -> Tuple[Optional[Path], str]:
+    async def download_no_convert(self, song: "Song") -> Tuple[Optional[Path], str]:
         """
         Download song without converting it.
         """
 
         return await self.downloader.audio_provider.download_single_song(song)
 
-    def download_list(self, songs: List[Song]) -> None:
+    def download_list(self, songs: List["Song"]) -> None:
         """
         Download and convert songs to the output format.
         """
@@ -117,14 +157,27 @@ class Spotdl:
         This is done by reinitializing the audio provider.
         """
 
-        audio_provider_class = AUDIO_PROVIDERS.get(self.audio_provider)
+        from spotdl.download.downloader import (
+            DownloaderError,
+            resolve_class,
+        )
+        from spotdl.download.registry import _AUDIO_PROVIDER_SPECS
 
-        if audio_provider_class is None:
+        if self.audio_provider not in _AUDIO_PROVIDER_SPECS:
             raise DownloaderError(f"Invalid audio provider: {self.audio_provider}")
 
+        audio_provider_class = resolve_class(_AUDIO_PROVIDER_SPECS[self.audio_provider])
+
         self.downloader.audio_provider = audio_provider_class(
             output_directory=output_directory,
             threads=self.downloader.threads,
             output_format=self.downloader.output_format,
             browsers=self.downloader.browsers,
         )
+
+    def close(self) -> None:
+        """
+        Release the resources held by the downloader, like the search cache.
+        """
+
+        self.downloader.close()
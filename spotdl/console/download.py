@@ -1,12 +1,47 @@
+import os
+import sys
 import traceback
+import unicodedata
 
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Set
 
 from spotdl.download.downloader import Downloader
-from spotdl.utils.query import parse_query
+from spotdl.utils.query import deduplicate_songs, parse_query
 from spotdl.utils.formatter import create_file_name
 
+# os.path.normcase folds the case of paths on Windows only, macOS filesystems
+# are usually case-insensitive too, so misses there are confirmed with a stat
+CONFIRM_MISSING_FILES = sys.platform == "darwin"
+
+
+def _normalize_path(path: Path) -> str:
+    """
+    Normalize the case and the unicode form of a path, so names listed
+    by the filesystem match the names created from the song metadata.
+    """
+
+    return unicodedata.normalize("NFC", os.path.normcase(str(path)))
+
+
+def _get_existing_files(directories: Iterable[Path]) -> Set[str]:
+    """
+    Return normalized paths of all files in the given directories.
+    Each directory is read only once with os.scandir.
+    """
+
+    existing_files: Set[str] = set()
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                existing_files.update(
+                    _normalize_path(directory / entry.name) for entry in entries
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+    return existing_files
+
 
 def download(
     query: List[str],
@@ -19,20 +54,45 @@ def download(
     try:
         songs_list = parse_query(query, downloader.threads)
 
-        songs = []
-        for song in songs_list:
-            song_path = create_file_name(
-                song, downloader.output, downloader.output_format
+        unique_songs = deduplicate_songs(songs_list)
+        if downloader.progress_handler and len(unique_songs) != len(songs_list):
+            downloader.progress_handler.debug(
+                "Skipping %d duplicate songs", len(songs_list) - len(unique_songs)
+            )
+
+        songs_list = unique_songs
+
+        if downloader.overwrite == "overwrite":
+            downloader.download_multiple_songs(songs_list)
+            return None
+
+        song_paths = [
+            (
+                song,
+                create_file_name(song, downloader.output, downloader.output_format),
             )
+            for song in songs_list
+        ]
 
-            if Path(song_path).exists():
-                if downloader.overwrite == "overwrite":
-                    songs.append(song)
-            else:
-                songs.append(song)
+        # List every output directory once instead of
+        # checking if each song's file exists
+        existing_files = _get_existing_files(
+            {song_path.parent for _, song_path in song_paths}
+        )
 
-        downloader.download_multiple_songs(songs)
+        # Pass the already created paths to the downloader,
+        # so it doesn't have to create them again
+        downloader.download_precomputed(
+            [
+                (song, song_path)
+                for song, song_path in song_paths
+                if _normalize_path(song_path) not in existing_files
+                and not (CONFIRM_MISSING_FILES and song_path.exists())
+            ]
+        )
     except Exception as exception:
         if downloader.progress_handler:
             downloader.progress_handler.debug(traceback.format_exc())
             downloader.progress_handler.error(str(exception))
+
+    return None
@@ -2,17 +2,11 @@ import sys
 import json
 import logging
 
-from spotdl.console.save import save
-from spotdl.download import Downloader
-from spotdl.console.preload import preload
-from spotdl.console.download import download
 from spotdl.utils.config import DEFAULT_CONFIG
 from spotdl.utils.ffmpeg import download_ffmpeg
 from spotdl.utils.config import get_config_file
 from spotdl.utils.arguments import parse_arguments
 from spotdl.utils.spotify import SpotifyClient, SpotifyError
-from spotdl.download.progress_handlers.base import NAME_TO_LEVEL
-from spotdl.download.downloader import DownloaderError, PROGRESS_HANDLERS
 
 
 def console_entry_point():
@@ -57,23 +51,14 @@ def console_entry_point():
 
     # Create settings dict
     # Settings from config file will override the ones from the command line
-    settings = {}
-    for key in DEFAULT_CONFIG:
-        if config.get(key) is None:
-            settings[key] = arguments.__dict__[key]
-        else:
-            settings[key] = config[key]
-
-    progress_handler_class = PROGRESS_HANDLERS.get(settings["progress_handler"])
-    progress_handler = (
-        progress_handler_class(
-            log_level=NAME_TO_LEVEL["DEBUG"]
-            if settings["verbose"]
-            else NAME_TO_LEVEL["INFO"],
-        )
-        if progress_handler_class
-        else None
-    )
+    settings = {
+        **{key: getattr(arguments, key) for key in DEFAULT_CONFIG},
+        **{
+            key: value
+            for key, value in config.items()
+            if value is not None and key in DEFAULT_CONFIG
+        },
+    }
 
     if arguments.query and "saved" in arguments.query and not settings["user_auth"]:
         raise SpotifyError("You must be logged in to use the saved query.")
@@ -85,7 +70,30 @@ def console_entry_point():
         user_auth=settings["user_auth"],
     )
 
+    # Commands are imported only when they are used, so the downloader
+    # and the providers aren't loaded for operations that don't need them
     if arguments.operation in ["download", "preload"]:
+        # pylint: disable=import-outside-toplevel
+        from spotdl.download.downloader import Downloader
+        from spotdl.console.preload import preload
+        from spotdl.console.download import download
+        from spotdl.download.progress_handlers.base import NAME_TO_LEVEL
+        from spotdl.download.registry import _PROGRESS_HANDLER_SPECS
+        from spotdl.download.downloader import DownloaderError, resolve_class
+
+        progress_handler_spec = _PROGRESS_HANDLER_SPECS.get(
+            settings["progress_handler"]
+        )
+        progress_handler = (
+            resolve_class(progress_handler_spec)(
+                log_level=NAME_TO_LEVEL["DEBUG"]
+                if settings["verbose"]
+                else NAME_TO_LEVEL["INFO"],
+            )
+            if progress_handler_spec
+            else None
+        )
+
         if arguments.operation == "preload":
             if not settings["save_file"].endswith(".spotdl"):
                 raise DownloaderError("Save file has to end with .spotdl")
@@ -108,15 +116,20 @@ def console_entry_point():
             progress_handler=progress_handler,  # type: ignore
         )
 
-        if arguments.operation == "download":
-            download(arguments.query, downloader=downloader)
-        elif arguments.operation == "preload":
-            preload(
-                query=arguments.query,
-                save_path=settings["save_file"],
-                downloader=downloader,
-            )
+        try:
+            if arguments.operation == "download":
+                download(arguments.query, downloader=downloader)
+            elif arguments.operation == "preload":
+                preload(
+                    query=arguments.query,
+                    save_path=settings["save_file"],
+                    downloader=downloader,
+                )
+        finally:
+            downloader.close()
     elif arguments.operation == "save":
+        from spotdl.console.save import save  # pylint: disable=import-outside-toplevel
+
         # Save the songs to a file
         save(
             query=arguments.query,
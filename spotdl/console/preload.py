@@ -1,10 +1,12 @@
+import os
 import json
-import concurrent.futures
+import textwrap
 
-from typing import List
+from typing import Any, List
 
+from spotdl.types import Song
 from spotdl.download.downloader import Downloader
-from spotdl.utils.query import parse_query
+from spotdl.utils.query import deduplicate_songs, parse_query
 
 
 def preload(
@@ -19,27 +21,53 @@ def preload(
     # Parse the query
     songs = parse_query(query, downloader.threads)
 
-    save_data = []
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=downloader.threads
-    ) as executor:
-        future_to_song = {
-            executor.submit(downloader.audio_provider.search, song): song
-            for song in songs
-        }
-        for future in concurrent.futures.as_completed(future_to_song):
-            song = future_to_song[future]
-            try:
-                data = future.result()
+    unique_songs = deduplicate_songs(songs)
+    if downloader.progress_handler and len(unique_songs) != len(songs):
+        downloader.progress_handler.debug(
+            "Skipping %d duplicate songs", len(songs) - len(unique_songs)
+        )
+
+    songs = unique_songs
+
+    # Save the songs to a file
+    # Entries are written as soon as their search finishes, laid out
+    # the same way as json.dump(entries, indent=4) would write them.
+    # They go to a temp file that replaces the save file only when every
+    # search has finished, so an interrupted run keeps the old save file
+    temp_path = f"{save_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as save_file:
+            saved_count = 0
+
+            def save_result(song: Song, data: Any) -> None:
+                nonlocal saved_count
+
+                if isinstance(data, Exception):
+                    print(f"{song} generated an exception: {data}")
+                    return
+
                 if data is None:
                     print(f"Didn't found download url for {song.display_name}")
-                    continue
+                    return
 
                 print(f"Found url for {song.display_name}: {data}")
-                save_data.append({**song.json, "download_url": data})
-            except Exception as exc:  # pylint: disable=W0703
-                print(f"{song} generated an exception: {exc}")
 
-    # Save the songs to a file
-    with open(save_path, "w", encoding="utf-8") as save_file:
-        json.dump(save_data, save_file, indent=4, ensure_ascii=False)
+                entry = json.dumps(
+                    {**song.json, "download_url": data}, indent=4, ensure_ascii=False
+                )
+                save_file.write("[\n" if saved_count == 0 else ",\n")
+                save_file.write(textwrap.indent(entry, " " * 4))
+                saved_count += 1
+
+            downloader.search_songs(songs, callback=save_result)
+
+            save_file.write("\n]" if saved_count else "[]")
+
+        os.replace(temp_path, save_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+        raise
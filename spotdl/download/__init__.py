@@ -1 +1,16 @@
-from spotdl.download.downloader import Downloader
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the downloader on first access, so importing the progress
+    handlers doesn't import the downloader too.
+    """
+
+    if name == "Downloader":
+        # pylint: disable=import-outside-toplevel
+        from spotdl.download.downloader import Downloader
+
+        return Downloader
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,40 +1,95 @@
+import os
+import sys
 import json
 import datetime
+import sqlite3
 import asyncio
+import functools
+import importlib
 import traceback
 
-from typing import List, Optional, Tuple
+from pathlib import Path
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from spotdl.types import Song
-from spotdl.utils.ffmpeg import FFmpeg
+from spotdl.utils.ffmpeg import DEFAULT_FFMPEG_ARGS, FFmpeg
 from spotdl.utils.ffmpeg import FFmpegError
-from spotdl.utils.metadata import embed_metadata
+from spotdl.utils.metadata import embed_metadata, prefetch_cover
 from spotdl.utils.formatter import create_file_name
-from spotdl.providers.audio.base import AudioProvider
-from spotdl.providers.lyrics import Genius, MusixMatch
-from spotdl.providers.lyrics.base import LyricsProvider
-from spotdl.providers.audio import YouTube, YouTubeMusic
-from spotdl.download.progress_handlers.logger import Logger
-from spotdl.download.progress_handlers.tui import Tui
+from spotdl.utils.search_cache import SearchCache
 from spotdl.utils.config import get_errors_path, get_temp_path
-from spotdl.download.progress_handlers.base import ProgressHandler
+from spotdl.download.progress_handlers.base import ProgressHandler, SongTracker
+from spotdl.download.registry import (
+    _AUDIO_PROVIDER_SPECS,
+    _LYRICS_PROVIDER_SPECS,
+    _PROGRESS_HANDLER_SPECS,
+)
+
+if TYPE_CHECKING:
+    # Importing the base classes would import every provider
+    # through the package __init__, so they are only used for type hints
+    from spotdl.providers.audio.base import AudioProvider
+    from spotdl.providers.lyrics.base import LyricsProvider
+
+
+# Lyrics of songs that were downloaded recently are kept in memory,
+# older ones are dropped so the cache doesn't grow with the playlist
+LYRICS_CACHE_SIZE = 256
+
+LyricsKey = Tuple[str, Tuple[str, ...]]
+
+# Downloaded files with these extensions are already in the output format
+# listed here, so they can be moved to the output directory without ffmpeg.
+# .ogg isn't listed, the file can hold opus audio but the ogg output is vorbis
+SKIP_CONVERSION_FORMATS = {
+    ".opus": "opus",
+    ".mp3": "mp3",
+    ".m4a": "m4a",
+}
 
 
-AUDIO_PROVIDERS = {
-    "youtube": YouTube,
-    "youtube-music": YouTubeMusic,
-}
+def _needs_convert(temp_file: Path, output_format: str, ffmpeg: FFmpeg) -> bool:
+    """
+    Check if the downloaded file has to be converted to the output format.
+    Files are always converted when a bitrate or ffmpeg arguments were passed.
+    """
 
-LYRICS_PROVIDERS = {
-    "genius": Genius,
-    "musixmatch": MusixMatch,
-}
+    if (
+        ffmpeg.variable_bitrate is not None
+        or ffmpeg.constant_bitrate is not None
+        or ffmpeg.ffmpeg_args != DEFAULT_FFMPEG_ARGS
+    ):
+        return True
+
+    return SKIP_CONVERSION_FORMATS.get(temp_file.suffix) != output_format
 
-PROGRESS_HANDLERS = {
-    "logger": Logger,
-    "tui": Tui,
-    # "gui": GuiProgressHandler,
-}
+
+def _safe_rename(src: Path, dst: Path) -> None:
+    """
+    Move src to dst, creating the parent directory of dst only if it's missing.
+    """
+
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(src, dst)
 
 
 class DownloaderError(Exception):
@@ -43,6 +98,72 @@ class DownloaderError(Exception):
     """
 
 
+def _discard_task(task: "asyncio.Task[Any]") -> None:
+    """
+    Cancel a task that is no longer needed, or mark its exception as
+    retrieved if it's already done, so the exception isn't logged.
+    """
+
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _run_coroutine(coroutine: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine in a new event loop.
+    ProactorEventLoop is required on Windows to run ffmpeg asynchronously,
+    it's the default since Python 3.8, older versions have to create it.
+    """
+
+    if sys.platform == "win32" and sys.version_info < (3, 8):
+        loop = asyncio.ProactorEventLoop()  # pylint: disable=no-member
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(coroutine)
+        finally:
+            asyncio.set_event_loop(None)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    return asyncio.run(coroutine)  # type: ignore
+
+
+def resolve_class(spec: str) -> Any:
+    """
+    Import and return a class from a "module:class" string.
+    """
+
+    module_name, class_name = spec.split(":")
+
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# The provider and progress handler tables map names to classes,
+# the classes are imported the first time one of the tables is used
+_CLASS_TABLES = {
+    "AUDIO_PROVIDERS": _AUDIO_PROVIDER_SPECS,
+    "LYRICS_PROVIDERS": _LYRICS_PROVIDER_SPECS,
+    "PROGRESS_HANDLERS": _PROGRESS_HANDLER_SPECS,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the provider and progress handler tables on first access.
+    """
+
+    specs = _CLASS_TABLES.get(name)
+    if specs is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    table = {key: resolve_class(spec) for key, spec in specs.items()}
+    globals()[name] = table
+
+    return table
+
+
 class Downloader:
     def __init__(
         self,
@@ -64,14 +185,15 @@ class Downloader:
         """
         Initialize the Downloader class.
         """
-        audio_provider_class = AUDIO_PROVIDERS.get(audio_provider)
-        if audio_provider_class is None:
+        if audio_provider not in _AUDIO_PROVIDER_SPECS:
             raise DownloaderError(f"Invalid audio provider: {audio_provider}")
 
-        lyrics_provider_class = LYRICS_PROVIDERS.get(lyrics_provider)
-        if lyrics_provider_class is None:
+        if lyrics_provider not in _LYRICS_PROVIDER_SPECS:
             raise DownloaderError(f"Invalid lyrics provider: {lyrics_provider}")
 
+        audio_provider_class = resolve_class(_AUDIO_PROVIDER_SPECS[audio_provider])
+        lyrics_provider_class = resolve_class(_LYRICS_PROVIDER_SPECS[lyrics_provider])
+
         self.temp_directory = get_temp_path()
         if self.temp_directory.exists() is False:
             self.temp_directory.mkdir()
@@ -84,21 +206,53 @@ class Downloader:
         self.browsers = browsers
         self.overwrite = overwrite
         self.progress_handler = progress_handler
-        self.audio_provider: AudioProvider = audio_provider_class(
+        self.audio_provider: "AudioProvider" = audio_provider_class(
             output_directory=self.temp_directory,
             threads=threads,
             output_format=output_format,
             browsers=browsers,
         )
-        self.lyrics_provider: LyricsProvider = lyrics_provider_class()
+
+        # Lyrics are fetched with a single session, so TCP and TLS
+        # connections are reused between songs
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.threads, pool_maxsize=self.threads * 4
+        )
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
+
+        self.lyrics_provider: "LyricsProvider" = lyrics_provider_class(
+            session=self.http_session
+        )
+
+        # Lyrics are cached by song name and artists, so songs that share
+        # them (remixes, compilations) don't query the lyrics provider twice.
+        # Only the most recently used lyrics are kept
+        self._lyrics_cache: "OrderedDict[LyricsKey, asyncio.Future[Optional[str]]]"
+        self._lyrics_cache = OrderedDict()
+
+        # Covers that are being downloaded, songs from the same album
+        # wait for the same download instead of starting their own
+        self._cover_fetches: Dict[str, "asyncio.Future[None]"] = {}
+
+        # Search results are cached between runs
+        self.search_cache = SearchCache()
+
+        # The m3u file is opened once per batch of downloads,
+        # songs can finish concurrently so writes are guarded by a lock
+        self._m3u_fh: Optional[TextIO] = None
+
+        # Every batch runs in a new event loop, so the lock and the semaphore
+        # are created by _download_songs inside the loop that uses them
+        self._m3u_lock: asyncio.Lock
+        self._conversion_semaphore: asyncio.Semaphore
         self.ffmpeg = FFmpeg(
             ffmpeg=ffmpeg,
             output_format=output_format,
             variable_bitrate=variable_bitrate,
             constant_bitrate=constant_bitrate,
-            ffmpeg_args=["-abr", "true", "-v", "debug"]
-            if ffmpeg_args is None
-            else ffmpeg_args,
+            ffmpeg_args=DEFAULT_FFMPEG_ARGS if ffmpeg_args is None else ffmpeg_args,
         )
 
         if self.progress_handler:
@@ -112,7 +266,7 @@ class Downloader:
         if self.progress_handler:
             self.progress_handler.set_song_count(1)
 
-        self._download_asynchronously([song])
+        self._download_asynchronously([(song, None)])
 
     def download_multiple_songs(self, songs: List[Song]) -> None:
         """
@@ -122,121 +276,439 @@ class Downloader:
         Embed metadata to the songs.
         """
 
+        if self.progress_handler:
+            self.progress_handler.set_song_count(len(songs))
+
+        self._download_asynchronously([(song, None) for song in songs])
+
+    def download_precomputed(self, songs: List[Tuple[Song, Path]]) -> None:
+        """
+        Download multiple songs whose output paths were already created
+        with create_file_name, so they don't have to be created again.
+        """
+
         if self.progress_handler:
             self.progress_handler.set_song_count(len(songs))
 
         self._download_asynchronously(songs)
 
-    def _download_asynchronously(self, songs: List[Song]):
+    def _download_asynchronously(self, songs: Sequence[Tuple[Song, Optional[Path]]]):
         """
         Download multiple songs asynchronously.
         """
 
-        tasks = [self._pool_download(song) for song in songs]
-        # call all task asynchronously, and wait until all are finished
-        self.audio_provider.loop.run_until_complete(asyncio.gather(*tasks))
+        if self.m3u_file:
+            self._m3u_fh = open(  # pylint: disable=consider-using-with
+                self.m3u_file, "a", encoding="utf-8"
+            )
+
+        try:
+            _run_coroutine(self._download_songs(songs))
+        finally:
+            self._close_m3u_file()
+
+    async def _download_songs(
+        self, songs: Sequence[Tuple[Song, Optional[Path]]]
+    ) -> None:
+        """
+        Download songs using a fixed number of workers.
+        Songs are passed to the workers through a bounded queue, so only
+        a few songs are waiting to be downloaded at any given time.
+        """
+
+        self._m3u_lock = asyncio.Lock()
+
+        # ffmpeg runs in its own process, so conversions are limited by
+        # the number of CPUs instead of the number of download threads
+        self._conversion_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        queue: "asyncio.Queue[Tuple[Song, Optional[Path]]]" = asyncio.Queue(
+            maxsize=self.threads * 2
+        )
+        errors: List[Exception] = []
+
+        # Every song holds a slot from the start of its download until it's
+        # converted, so a worker waits for a slot before taking the next song
+        # and only a bounded number of downloaded songs wait for conversion
+        song_slots = asyncio.Semaphore(self.threads + (os.cpu_count() or 1))
+        conversions: Set["asyncio.Task[None]"] = set()
+
+        def conversion_done(task: "asyncio.Task[None]") -> None:
+            conversions.discard(task)
+            song_slots.release()
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())  # type: ignore
+
+        async def worker() -> None:
+            while True:
+                await song_slots.acquire()
+                song, output_file = await queue.get()
+                conversion = None
+                try:
+                    conversion = await self._download_stage(song, output_file)
+                except Exception as exception:  # pylint: disable=broad-except
+                    errors.append(exception)
+                finally:
+                    if conversion is None:
+                        song_slots.release()
+                    else:
+                        conversions.add(conversion)
+                        conversion.add_done_callback(conversion_done)
+
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.threads)]
+        try:
+            for song_with_path in songs:
+                await queue.put(song_with_path)
+
+            # wait until all songs are downloaded and converted
+            await queue.join()
+            await asyncio.gather(*conversions, return_exceptions=True)
+        finally:
+            for task in workers + list(conversions):
+                task.cancel()
+
+            await asyncio.gather(*workers, *conversions, return_exceptions=True)
+
+        if errors:
+            raise errors[0]
+
+    def _close_m3u_file(self) -> None:
+        """
+        Close the m3u file if it's open.
+        """
+
+        if self._m3u_fh is not None:
+            self._m3u_fh.close()
+            self._m3u_fh = None
+
+    def close(self) -> None:
+        """
+        Release resources held by the downloader.
+        """
+
+        self._close_m3u_file()
+        self.search_cache.close()
+        self.http_session.close()
+
+        if self.progress_handler:
+            self.progress_handler.close()
+
+    def search_songs(
+        self,
+        songs: List[Song],
+        callback: Optional[Callable[[Song, Any], None]] = None,
+    ) -> List[Tuple[Song, Any]]:
+        """
+        Search for download urls of multiple songs concurrently.
+        Returns a list of (song, result) tuples, where result is the download url,
+        None if no match was found, or the exception raised while searching.
+        If callback is passed, it's called with every (song, result) pair
+        as soon as the search finishes, in the order the searches finish.
+        """
+
+        return _run_coroutine(self._search_songs(songs, callback))
+
+    async def _search_songs(
+        self,
+        songs: List[Song],
+        callback: Optional[Callable[[Song, Any], None]] = None,
+    ) -> List[Tuple[Song, Any]]:
+        """
+        Search for songs using a fixed number of workers.
+        Results are returned in the same order as the songs.
+        """
 
-    async def _pool_download(self, song: Song) -> None:
+        queue: "asyncio.Queue[Tuple[int, Song]]" = asyncio.Queue()
+        results: List[Tuple[Song, Any]] = [(song, None) for song in songs]
+        errors: List[Exception] = []
+
+        async def worker() -> None:
+            while True:
+                index, song = await queue.get()
+                try:
+                    results[index] = await self._search_song(song)
+                    if callback is not None:
+                        callback(*results[index])
+                except Exception as exception:  # pylint: disable=broad-except
+                    errors.append(exception)
+                finally:
+                    queue.task_done()
+
+        for index, song in enumerate(songs):
+            queue.put_nowait((index, song))
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.threads)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if errors:
+            raise errors[0]
+
+        return results
+
+    async def _search_song(self, song: Song) -> Tuple[Song, Any]:
+        """
+        Search for a download url of a single song.
+        Cached results are used instead of searching again.
+        """
+
+        provider = self.audio_provider.name
+
+        # The cache only saves time, so songs are searched again
+        # and still returned if it can't be read or written
+        try:
+            url = self.search_cache.get(song.url, provider)
+        except (sqlite3.Error, OSError):
+            self._log_cache_error(song)
+            url = None
+
+        if url is not None:
+            return song, url
+
+        try:
+            url = await self.audio_provider.search_async(song)
+        except Exception as exception:  # pylint: disable=broad-except
+            return song, exception
+
+        if url is not None:
+            try:
+                self.search_cache.set(song.url, provider, url)
+            except (sqlite3.Error, OSError):
+                self._log_cache_error(song)
+
+        return song, url
+
+    def _log_cache_error(self, song: Song) -> None:
+        """
+        Log a search cache error as a debug message.
+        """
+
+        if self.progress_handler:
+            self.progress_handler.debug(
+                "Search cache error for %s: %s",
+                song.display_name,
+                traceback.format_exc(),
+            )
+
+    async def _get_lyrics(self, song: Song) -> str:
+        """
+        Get lyrics for a song from the lyrics provider or the lyrics cache.
+        The lyrics provider is called in the default executor,
+        so lyrics of multiple songs are fetched concurrently.
+        """
+
+        loop = asyncio.get_running_loop()
+        lyrics_key = (song.name, tuple(song.artists))
+        lyrics_future = self._lyrics_cache.get(lyrics_key)
+
+        # Futures left pending by a previous batch belong to a closed loop
+        if lyrics_future is None or (
+            not lyrics_future.done() and lyrics_future.get_loop() is not loop
+        ):
+            # The future is cached right away, so songs that are downloaded
+            # at the same time wait for the same request
+            lyrics_future = loop.run_in_executor(
+                None, self.lyrics_provider.get_lyrics, song.name, song.artists
+            )
+            self._lyrics_cache[lyrics_key] = lyrics_future
+            if len(self._lyrics_cache) > LYRICS_CACHE_SIZE:
+                self._lyrics_cache.popitem(last=False)
+        else:
+            self._lyrics_cache.move_to_end(lyrics_key)
+
+        try:
+            # Shielded, so a cancelled song doesn't cancel
+            # the request other songs are waiting for
+            return await asyncio.shield(lyrics_future) or ""
+        except Exception:
+            # Don't cache failed requests
+            self._lyrics_cache.pop(lyrics_key, None)
+            raise
+
+    def _prefetch_cover(self, song: Song) -> "asyncio.Future[None]":
+        """
+        Download the cover of a song into the cover cache in the default
+        executor. Returns the future of the download already in progress
+        if another song with the same cover started it.
+        """
+
+        loop = asyncio.get_running_loop()
+        cover_url = song.cover_url or ""
+        cover_future = self._cover_fetches.get(cover_url)
+
+        # Futures left pending by a previous batch belong to a closed loop
+        if cover_future is None or cover_future.get_loop() is not loop:
+            cover_future = loop.run_in_executor(None, prefetch_cover, song)
+            self._cover_fetches[cover_url] = cover_future
+
+            # Finished covers are in the cover cache, only the downloads
+            # in progress are kept here
+            def forget(future: "asyncio.Future[None]") -> None:
+                if self._cover_fetches.get(cover_url) is future:
+                    del self._cover_fetches[cover_url]
+
+            cover_future.add_done_callback(forget)
+
+        return cover_future
+
+    async def _download_stage(
+        self, song: Song, output_file: Optional[Path] = None
+    ) -> Optional["asyncio.Task[None]"]:
         """
         Download a song to the temp directory.
-        After that convert the song to the output format with ffmpeg.
-        And move it to the output directory following the output format.
-        Embed metadata to the song.
+        Returns the task that converts the song and embeds its metadata,
+        or None if the song wasn't downloaded.
         """
 
-        # Run asynchronous task in a pool to make sure that all processes
-        # don't run at once.
-        # tasks that cannot acquire semaphore will wait here until it's free
-        # only certain amount of tasks can acquire the semaphore at the same time
-        async with self.audio_provider.semaphore:
+        display_progress_tracker = None
+        lyrics_task: Optional["asyncio.Task[str]"] = None
+        try:
             # Initalize the progress tracker
-            display_progress_tracker = None
             if self.progress_handler:
                 display_progress_tracker = self.progress_handler.get_new_tracker(song)
                 self.audio_provider.add_progress_hook(
                     display_progress_tracker.progress_hook
                 )
+
+            # Lyrics are fetched while the song is downloaded and converted
+            lyrics_task = asyncio.create_task(self._get_lyrics(song))
+
+            # The cover art is downloaded in the background as well
+            cover_future = self._prefetch_cover(song)
+
             try:
-                try:
-                    temp_file, url = await self.audio_provider.download_single_song(
-                        song
-                    )
-                except Exception as exception:
-                    raise DownloaderError(
-                        f'Unable to get audio stream for "{song.display_name}: {song.url}"'
-                    ) from exception
-
-                if self.progress_handler:
-                    self.progress_handler.log(
-                        f'Downloaded "{song.display_name}": {url}'
-                    )
+                temp_file, url = await self.audio_provider.download_single_song(song)
+            except Exception as exception:
+                raise DownloaderError(
+                    f'Unable to get audio stream for "{song.display_name}: {song.url}"'
+                ) from exception
+
+            if self.progress_handler:
+                self.progress_handler.log('Downloaded "%s": %s', song.display_name, url)
 
-                # Song failed to download or something went wrong
-                if temp_file is None:
-                    return None
+            # Song failed to download or something went wrong
+            if temp_file is None:
+                return None
 
-                if display_progress_tracker:
-                    display_progress_tracker.notify_download_complete()
+            if display_progress_tracker:
+                display_progress_tracker.notify_download_complete()
 
+            if output_file is None:
                 output_file = create_file_name(song, self.output, self.output_format)
-                if output_file.exists() is False:
-                    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # Don't convert m4a files
-                # just move the file to the output directory
-                if temp_file.suffix == ".m4a" and self.output_format == "m4a":
-                    temp_file.rename(output_file)
-                    success = True
-                    error_message = None
-                else:
+
+            # The conversion runs in its own task, so the caller
+            # can start downloading the next song right away
+            conversion = asyncio.create_task(
+                self._conversion_stage(
+                    song,
+                    temp_file,
+                    output_file,
+                    display_progress_tracker,
+                    lyrics_task,
+                    cover_future,
+                )
+            )
+            lyrics_task = None
+
+            return conversion
+        except Exception as exception:
+            if display_progress_tracker:
+                display_progress_tracker.notify_error(traceback.format_exc(), exception)
+            else:
+                raise exception
+
+            return None
+        finally:
+            # Lyrics aren't needed if the song failed
+            if lyrics_task is not None:
+                _discard_task(lyrics_task)
+
+    async def _conversion_stage(  # pylint: disable=too-many-arguments
+        self,
+        song: Song,
+        temp_file: Path,
+        output_file: Path,
+        display_progress_tracker: Optional[SongTracker],
+        lyrics_task: "asyncio.Task[str]",
+        cover_future: "asyncio.Future[None]",
+    ) -> None:
+        """
+        Convert a downloaded song to the output format with ffmpeg.
+        And move it to the output directory following the output format.
+        Embed metadata to the song.
+        """
+
+        # Blocking filesystem calls are run in the default executor
+        # so they don't stall the other downloads running on the loop
+        loop = asyncio.get_running_loop()
+
+        try:
+            # Don't convert files that are already in the output format
+            # just move the file to the output directory
+            if not _needs_convert(temp_file, self.output_format, self.ffmpeg):
+                await loop.run_in_executor(None, _safe_rename, temp_file, output_file)
+                success = True
+                error_message = None
+            else:
+                await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        output_file.parent.mkdir, parents=True, exist_ok=True
+                    ),
+                )
+                async with self._conversion_semaphore:
                     success, error_message = await self.ffmpeg.convert(
                         input_file=temp_file,
                         output_file=output_file,
                     )
-                    temp_file.unlink()
-
-                if success is False and error_message:
-                    # If the conversion failed and there is an error message
-                    # create a file with the error message
-                    # and save it in the errors directory
-                    # raise an exception with file path
-                    file_name = get_errors_path() / f"ffmpeg_{datetime.date.today()}"
-                    with open(file_name, "w", encoding="utf-8") as error_path:
-                        json.dump(
-                            error_message, error_path, ensure_ascii=False, indent=4
-                        )
-
-                    raise FFmpegError(
-                        f"Failed to convert {song.name}"
-                        f", you can find error here: {str(file_name.absolute())}"
-                    )
-
-                if display_progress_tracker:
-                    display_progress_tracker.notify_conversion_complete()
-
-                lyrics = self.lyrics_provider.get_lyrics(song.name, song.artists)
-                if not lyrics:
-                    if self.progress_handler:
-                        self.progress_handler.debug(
-                            f"No lyrics found for {song.name} - {song.artist}"
-                        )
-
-                    lyrics = ""
+                await loop.run_in_executor(None, temp_file.unlink)
+
+            if success is False and error_message:
+                # If the conversion failed and there is an error message
+                # create a file with the error message
+                # and save it in the errors directory
+                # raise an exception with file path
+                file_name = get_errors_path() / f"ffmpeg_{datetime.date.today()}"
+                with open(file_name, "w", encoding="utf-8") as error_path:
+                    json.dump(error_message, error_path, ensure_ascii=False, indent=4)
+
+                raise FFmpegError(
+                    f"Failed to convert {song.name}"
+                    f", you can find error here: {str(file_name.absolute())}"
+                )
 
-                embed_metadata(output_file, song, self.output_format, lyrics)
-                if display_progress_tracker:
-                    display_progress_tracker.notify_complete()
+            if display_progress_tracker:
+                display_progress_tracker.notify_conversion_complete()
 
-                if self.m3u_file:
-                    # Append file path to m3u file
-                    with open(self.m3u_file, "a+", encoding="utf-8") as m3u_file:
-                        m3u_file.write(f"{output_file}\n")
+            lyrics = await lyrics_task
+            if not lyrics and self.progress_handler:
+                self.progress_handler.debug(
+                    "No lyrics found for %s - %s", song.name, song.artist
+                )
 
-                return None
-            except Exception as exception:
-                if display_progress_tracker:
-                    display_progress_tracker.notify_error(
-                        traceback.format_exc(), exception
+            # Shielded, the download is shared with the other songs
+            await asyncio.shield(cover_future)
+            embed_metadata(output_file, song, self.output_format, lyrics)
+            if display_progress_tracker:
+                display_progress_tracker.notify_complete()
+
+            if self._m3u_fh is not None:
+                # Append file path to m3u file
+                async with self._m3u_lock:
+                    await loop.run_in_executor(
+                        None, self._m3u_fh.write, f"{output_file}\n"
                     )
-                else:
-                    raise exception
+        except Exception as exception:
+            if display_progress_tracker:
+                display_progress_tracker.notify_error(traceback.format_exc(), exception)
+            else:
+                raise exception
+        finally:
+            _discard_task(lyrics_task)
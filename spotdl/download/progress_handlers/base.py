@@ -1,4 +1,6 @@
-from typing import List
+import time
+
+from typing import List, Optional
 
 from spotdl.types import Song
 
@@ -13,6 +15,10 @@ INFO = 20
 DEBUG = 10
 NOTSET = 0
 
+# Minimum time in seconds between two progress updates
+# triggered by the yt-dlp progress hook
+PROGRESS_HOOK_INTERVAL = 0.25
+
 LEVEL_TO_NAME = {
     CRITICAL: "CRITICAL",
     ERROR: "ERROR",
@@ -80,28 +86,30 @@ class ProgressHandler:
         self.songs = songs
         self.set_song_count(len(songs))
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """
         Logs a debug message.
+        Arguments are merged into the message with %-formatting,
+        only if the message is going to be logged.
         """
 
         raise NotImplementedError
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, *args) -> None:
         """
         Logs a message.
         """
 
         raise NotImplementedError
 
-    def warn(self, message: str) -> None:
+    def warn(self, message: str, *args) -> None:
         """
         Logs a warning message.
         """
 
         raise NotImplementedError
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """
         Logs an error message.
         """
@@ -145,6 +153,13 @@ class SongTracker:
         self.download_id: int = 0
         self.status = ""
 
+        # Byte counters reported by the yt-dlp progress hook
+        self._downloaded: int = 0
+        self._total: int = 0
+
+        self._last_logged_status: Optional[str] = None
+        self._last_hook_update = 0.0
+
     def update(self, message: str) -> None:
         """
         Updates the progress.
@@ -163,7 +178,11 @@ class SongTracker:
         self.parent.overall_progress += delta
         self.old_progress = self.progress
 
-        self.parent.log(f"{self.song.name} - {self.song.artist}: {message}")
+        # Only log status changes, not every progress tick
+        if message != self._last_logged_status:
+            self._last_logged_status = message
+            self.parent.log("%s - %s: %s", self.song.name, self.song.artist, message)
+
         self.parent.update_overall()
 
     def notify_error(self, message: str, traceback: Exception) -> None:
@@ -206,14 +225,20 @@ class SongTracker:
         """
 
         # YT-dlp progress hook
-        if type(args) == tuple and len(args) == 1:
+        # args is always a tuple here, yt-dlp passes a single status dict
+        if len(args) == 1:
             data = args[0]
-            status = data.get("status")
-            file_bytes = data.get("total_bytes")
-            downloaded_bytes = data.get("downloaded_bytes")
-            if None not in [status, file_bytes, downloaded_bytes]:
-                if status == "downloading":
-                    if file_bytes and downloaded_bytes:
-                        self.progress = downloaded_bytes / file_bytes * 90
-
+            if data.get("status") == "downloading":
+                self._total = int(data.get("total_bytes") or 0)
+                self._downloaded = int(data.get("downloaded_bytes") or 0)
+                if self._total and self._downloaded:
+                    self.progress = self._downloaded * 90 // self._total
+
+        # yt-dlp calls the hook many times per second,
+        # so updates are limited to one per PROGRESS_HOOK_INTERVAL
+        now = time.monotonic()
+        if now - self._last_hook_update < PROGRESS_HOOK_INTERVAL:
+            return
+
+        self._last_hook_update = now
         self.update("Downloading")
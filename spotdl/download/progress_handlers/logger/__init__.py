@@ -12,33 +12,42 @@ from spotdl.download.progress_handlers.base import (
 from spotdl.types.song import Song
 
 
+# Handlers are configured once, Logger instances only change the level
+logging.basicConfig(
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+)
+
+
 class Logger(ProgressHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        logging.basicConfig(
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%H:%M:%S",
-            level=self.log_level,
-        )
+        logging.getLogger().setLevel(self.log_level)
 
         self.previous_overall = self.overall_completed_tasks
 
-    def debug(self, message: str) -> None:
-        logging.debug(message)
+    def debug(self, message: str, *args) -> None:
+        # Skip the logging call entirely when debug messages are disabled
+        if not logging.root.isEnabledFor(logging.DEBUG):
+            return
+
+        logging.debug(message, *args)
 
-    def log(self, message: str) -> None:
-        logging.info(message)
+    def log(self, message: str, *args) -> None:
+        logging.info(message, *args)
 
-    def warn(self, message: str) -> None:
-        logging.warning(message)
+    def warn(self, message: str, *args) -> None:
+        logging.warning(message, *args)
 
-    def error(self, message: str) -> None:
-        logging.error(message)
+    def error(self, message: str, *args) -> None:
+        logging.error(message, *args)
 
     def update_overall(self) -> None:
         if self.previous_overall != self.overall_completed_tasks:
-            logging.info(f"{self.overall_completed_tasks}/{self.song_count} complete")
+            logging.info(
+                "%d/%d complete", self.overall_completed_tasks, self.song_count
+            )
             self.previous_overall = self.overall_completed_tasks
 
     def get_new_tracker(self, song: Song):
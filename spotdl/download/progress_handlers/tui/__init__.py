@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from rich.text import Text
 from rich.theme import Theme
@@ -107,66 +107,95 @@ class Tui(ProgressHandler):
             # the following line. You can also make the progress display disappear on
             # exit by setting transient=True on the Progress constructor
             transient=self.is_legacy,
+            # The display is refreshed manually after the progress is updated,
+            # instead of re-rendering it on a timer
+            auto_refresh=False,
         )
 
         self.quiet = self.log_level > 20
         self.overall_task_id = None
 
+        # Messages are printed in batches when the progress is updated,
+        # printing each message separately re-renders the whole display
+        self._line_buffer: List[str] = []
+        self._overall_total_str = "0"
+
         # Basically a wrapper for rich's: with ... as ...
         self.rich_progress_bar.__enter__()
 
     def set_song_count(self, count: int) -> None:
         super().set_song_count(count)
 
+        # The total doesn't change between updates, so it's formatted once
+        self._overall_total_str = str(self.overall_total // 100)
+
         if self.song_count > 4:
             self.overall_task_id = self.rich_progress_bar.add_task(
                 description="Total",
                 process_id="0",
                 message=(
-                    f"{self.overall_completed_tasks}/{int(self.overall_total / 100)}"
-                    "complete"
+                    f"{self.overall_completed_tasks}/{self._overall_total_str} complete"
                 ),
                 total=self.overall_total,
                 visible=(not self.quiet),
             )
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         if self.log_level > DEBUG:
             return
 
-        self.rich_progress_bar.console.print(f"[blue]{message}")
+        self._line_buffer.append(f"[blue]{message % args if args else message}")
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, *args) -> None:
         if self.log_level > INFO:
             return
 
-        self.rich_progress_bar.console.print(f"[green]{message}")
+        self._line_buffer.append(f"[green]{message % args if args else message}")
 
-    def warn(self, message: str) -> None:
+    def warn(self, message: str, *args) -> None:
         if self.log_level > WARNING:
             return
 
-        self.rich_progress_bar.console.print(f"[yellow]{message}")
+        self._line_buffer.append(f"[yellow]{message % args if args else message}")
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         if self.log_level > ERROR:
             return
 
-        self.rich_progress_bar.console.print(f"[red]{message}")
+        self._line_buffer.append(f"[red]{message % args if args else message}")
+
+    def _flush(self) -> None:
+        """
+        Print the buffered messages.
+        """
+
+        # The buffer is swapped before printing, messages are added from the
+        # event loop while this runs in the progress hook threads
+        lines, self._line_buffer = self._line_buffer, []
+        if lines:
+            self.rich_progress_bar.console.print("\n".join(lines))
 
     def update_overall(self) -> None:
+        self._flush()
+
         # If the overall progress bar exists
         if self.overall_task_id is not None:
             self.rich_progress_bar.update(
                 self.overall_task_id,
-                message=f"{self.overall_completed_tasks}/{int(self.overall_total / 100)} complete",
+                message=(
+                    f"{self.overall_completed_tasks}/{self._overall_total_str} complete"
+                ),
                 completed=self.overall_progress,
             )
 
+        self.rich_progress_bar.refresh()
+
     def get_new_tracker(self, song: Song):
         return TuiSongTracker(self, song)
 
     def close(self) -> None:
+        self._flush()
+        self.rich_progress_bar.refresh()
         self.rich_progress_bar.stop()
 
 
@@ -216,3 +245,10 @@ class TuiSongTracker(SongTracker):
         self.parent.update_overall()
 
         self.old_progress = self.progress
+
+    def notify_error(self, message: str, traceback: Exception) -> None:
+        super().notify_error(message, traceback)
+
+        # The error is logged after the progress update,
+        # print it now instead of with the next update
+        self.parent._flush()  # pylint: disable=protected-access
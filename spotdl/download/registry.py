@@ -0,0 +1,18 @@
+# Providers and progress handlers are stored as "module:class" strings
+# and imported only when they are used, so importing the downloader or the
+# argument parser doesn't pull in yt-dlp, ytmusicapi, rich, etc.
+_AUDIO_PROVIDER_SPECS = {
+    "youtube": "spotdl.providers.audio:YouTube",
+    "youtube-music": "spotdl.providers.audio:YouTubeMusic",
+}
+
+_LYRICS_PROVIDER_SPECS = {
+    "genius": "spotdl.providers.lyrics:Genius",
+    "musixmatch": "spotdl.providers.lyrics:MusixMatch",
+}
+
+_PROGRESS_HANDLER_SPECS = {
+    "logger": "spotdl.download.progress_handlers.logger:Logger",
+    "tui": "spotdl.download.progress_handlers.tui:Tui",
+    # "gui": GuiProgressHandler,
+}
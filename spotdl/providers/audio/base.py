@@ -1,13 +1,15 @@
 from pathlib import Path
 from spotdl.types import Song
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 import asyncio
-import sys
 import concurrent.futures
 
 
 class AudioProvider:
+    # Name of the provider, set by subclasses
+    name: str
+
     def __init__(
         self,
         output_directory: str,
@@ -19,17 +21,8 @@ class AudioProvider:
         Base class for audio providers.
         """
 
-        if sys.platform == "win32":
-            # ProactorEventLoop is required on Windows to run subprocess asynchronously
-            # it is default since Python 3.8 but has to be changed for previous versions
-            loop = asyncio.ProactorEventLoop()
-            asyncio.set_event_loop(loop)
-
-        self.loop = asyncio.get_event_loop()
-        # semaphore is required to limit concurrent asyncio executions
-        self.semaphore = asyncio.Semaphore(threads)
-
         # thread pool executor is used to run blocking (CPU-bound) code from a thread
+        # it also limits the number of concurrent searches and downloads
         self.thread_executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=threads
         )
@@ -44,7 +37,9 @@ class AudioProvider:
         """
 
         if song.download_url is None:
-            url = self.search(song)
+            # Search in the executor, so other downloads running
+            # on the event loop aren't blocked by the search requests
+            url = await self.search_async(song)
             if url is None:
                 raise LookupError(
                     f"No results found for song: {song.name} - {song.artist}"
@@ -54,6 +49,17 @@ class AudioProvider:
 
         return await self.perform_download(url), url
 
+    async def search_async(self, song: Song) -> Optional[str]:
+        """
+        Search for a song without blocking the event loop.
+        The search is run in the thread pool executor,
+        so searches can overlap with each other.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.thread_executor, self.search, song
+        )
+
     async def perform_download(self, url: str) -> Optional[Path]:
         """
         The following function calls blocking code, which would block whole event loop.
@@ -62,7 +68,7 @@ class AudioProvider:
         hurt performance.
         """
 
-        return await self.loop.run_in_executor(
+        return await asyncio.get_running_loop().run_in_executor(
             self.thread_executor, self.perform_audio_download, url
         )
 
@@ -87,9 +93,9 @@ class AudioProvider:
         song_artists: List[str],
         song_album_name: str,
         song_duration: int,
-    ) -> Dict[str, Any]:
+    ) -> Iterator[Tuple[str, float]]:
         """
-        Order results.
+        Score results, yields (link, score) pairs for results that match the song.
         """
 
         raise NotImplementedError
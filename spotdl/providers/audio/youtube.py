@@ -1,15 +1,20 @@
+import functools
+
 from spotdl.utils.formatter import create_song_title
-from spotdl.utils.providers import match_percentage
+from spotdl.utils.providers import (
+    ISRC_MATCH_THRESHOLD,
+    best_result,
+    match_percentage,
+    slugify,
+    total_match_percentage,
+)
 from spotdl.providers.audio.base import AudioProvider
 from spotdl.types import Song
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 from pytube import YouTube as PyTube, Search
-from slugify.main import Slugify
 from yt_dlp import YoutubeDL
 from pathlib import Path
 
-slugify = Slugify(to_lower=True)
-
 
 class YTDLLogger(object):
     def debug(self, msg):
@@ -49,6 +54,10 @@ class YouTube(AudioProvider):
             }
         )
 
+        # Repeated searches for the same term reuse the results,
+        # the cache is dropped together with the provider
+        self._search = functools.lru_cache(maxsize=1024)(self._search_youtube)
+
     def perform_audio_download(self, url: str) -> Optional[Path]:
         """
         Download a song from YouTube Music and save it to the output directory.
@@ -72,6 +81,18 @@ class YouTube(AudioProvider):
                 if isrc_result and isrc_result.watch_url is not None:
                     return isrc_result.watch_url
 
+            # Multiple results for the isrc, accept the best one
+            # if it's a good enough match to skip the title search
+            elif isrc_results:
+                best_isrc = best_result(
+                    self.order_results(
+                        isrc_results, song.name, song.artists, song.duration
+                    )
+                )
+
+                if best_isrc is not None and best_isrc[1] >= ISRC_MATCH_THRESHOLD:
+                    return best_isrc[0]
+
         slug_song_title = create_song_title(song.name, song.artists)
 
         # Query YTM by songs only first, this way if we get correct result on the first try
@@ -82,27 +103,29 @@ class YouTube(AudioProvider):
         if results is None:
             return None
 
-        # Order results
-        ordered_results = self.order_results(
-            results, song.name, song.artists, song.duration
+        # Get the result with highest score
+        best = best_result(
+            self.order_results(results, song.name, song.artists, song.duration)
         )
 
         # No matches found
-        if len(ordered_results) == 0:
+        if best is None:
             return None
 
-        result_items = list(ordered_results.items())
-
-        # Sort results by highest score
-        sorted_results = sorted(result_items, key=lambda x: x[1], reverse=True)
-
-        # Return the first result
-        return sorted_results[0][0]
+        return best[0]
 
     def get_results(self, search_term: str) -> Optional[List[PyTube]]:
         """
         Get results from YouTube
         """
+        return self._search(search_term)
+
+    @staticmethod
+    def _search_youtube(search_term: str) -> Optional[List[PyTube]]:
+        """
+        Search YouTube for the given term.
+        """
+
         return Search(search_term).results
 
     def order_results(
@@ -111,14 +134,15 @@ class YouTube(AudioProvider):
         song_name: str,
         song_artists: List[str],
         song_duration: int,
-    ) -> dict:
-
-        # Assign an overall avg match value to each result
-        links_with_match_value = {}
+    ) -> Iterator[Tuple[str, float]]:
 
         # Slugify song title
         slug_song_title = slugify(create_song_title(song_name, song_artists))
         slug_song_name = slugify(song_name)
+        slug_song_artists = [slugify(artist) for artist in song_artists]
+        # Words of the song name, used to skip results with no common words
+        sentence_words = set(slug_song_name.split("-"))
+        sentence_words.discard("")
 
         for result in results:
             # Skip results without id
@@ -127,26 +151,16 @@ class YouTube(AudioProvider):
 
             # Slugify some variables
             slug_result_name = slugify(result.title)
-            sentence_words = slug_song_name.replace("-", " ").split(" ")
-
-            # Check for common words in result name
-            common_word = any(
-                word != "" and word in slug_result_name for word in sentence_words
-            )
 
             # skip results that have no common words in their name
-            if not common_word:
+            if sentence_words.isdisjoint(slug_result_name.split("-")):
                 continue
 
-            # Find artist match
-            artist_match_number = 0.0
-
             # Calculate artist match for each artist
             # in the song's artist list
-            for artist in song_artists:
-                artist_match_number += match_percentage(
-                    slugify(artist), slug_result_name
-                )
+            artist_match_number = total_match_percentage(
+                slug_song_artists, slug_result_name
+            )
 
             # skip results with artist match lower than 70%
             artist_match = artist_match_number / len(song_artists)
@@ -161,16 +175,15 @@ class YouTube(AudioProvider):
                 continue
 
             # Calculate time match
-            time_match = (
-                100 - (result.length - song_duration ** 2) / song_duration * 100
-            )
+            delta = result.length - song_duration
+            non_match_value = (delta ** 2) / song_duration * 100
+
+            time_match = 100 - non_match_value
 
             average_match = (artist_match + name_match + time_match) / 3
 
             # the results along with the avg Match
-            links_with_match_value[result.watch_url] = average_match
-
-        return links_with_match_value
+            yield result.watch_url, average_match
 
     def add_progress_hook(self, hook: Callable) -> None:
         """
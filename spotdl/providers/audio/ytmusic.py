@@ -1,15 +1,20 @@
+import functools
+
 from spotdl.utils.formatter import create_song_title, parse_duration
-from spotdl.utils.providers import match_percentage
+from spotdl.utils.providers import (
+    ISRC_MATCH_THRESHOLD,
+    best_result,
+    match_percentage,
+    slugify,
+    total_match_percentage,
+)
 from spotdl.providers.audio.base import AudioProvider
 from spotdl.types import Song
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from ytmusicapi import YTMusic
-from slugify.main import Slugify
 from yt_dlp import YoutubeDL
 from pathlib import Path
 
-slugify = Slugify(to_lower=True)
-
 
 class YTDLLogger(object):
     def debug(self, msg):
@@ -32,6 +37,9 @@ class YouTubeMusic(AudioProvider):
         super().__init__(*args, **kwargs)
         self.client = YTMusic()
 
+        # Repeated searches for the same term and filter reuse the results
+        self._search = functools.lru_cache(maxsize=1024)(self.client.search)
+
         if self.output_format == "m4a":
             ytdl_format = "bestaudio[ext=m4a]/bestaudio/best"
         elif self.output_format == "opus":
@@ -91,57 +99,66 @@ class YouTubeMusic(AudioProvider):
                 ):
                     return isrc_result["link"]
 
+            # Multiple results for the isrc, accept the best one
+            # if it's a good enough match to skip the title search
+            elif len(isrc_results) > 1:
+                best_isrc = best_result(
+                    self.order_results(
+                        isrc_results,
+                        song.name,
+                        song.artists,
+                        song.album_name,
+                        song.duration,
+                    )
+                )
+
+                if best_isrc is not None and best_isrc[1] >= ISRC_MATCH_THRESHOLD:
+                    return best_isrc[0]
+
         song_title = create_song_title(song.name, song.artists).lower()
 
         # Query YTM by songs only first, this way if we get correct result on the first try
         # we don't have to make another request
         song_results = self.get_results(song_title, "songs")
 
-        # Order results
-        songs = self.order_results(
-            song_results, song.name, song.artists, song.album_name, song.duration
+        # Get the song result with highest score
+        best_song = best_result(
+            self.order_results(
+                song_results, song.name, song.artists, song.album_name, song.duration
+            )
         )
 
         # song type results are always more accurate than video type, so if we get score of 80 or above
         # we are almost 100% sure that this is the correct link
-        if len(songs) != 0:
-            # get the result with highest score
-            best_result = max(songs, key=lambda k: songs[k])
-
-            if songs[best_result] >= 80:
-                return best_result
+        if best_song is not None and best_song[1] >= 80:
+            return best_song[0]
 
         # We didn't find the correct song on the first try so now we get video type results
         # add them to song_results, and get the result with highest score
         video_results = self.get_results(song_title, filter="videos")
 
-        # Order video results
-        videos = self.order_results(
-            video_results, song.name, song.artists, song.album_name, song.duration
+        # Get the video result with highest score
+        best_video = best_result(
+            self.order_results(
+                video_results, song.name, song.artists, song.album_name, song.duration
+            )
         )
 
-        # Merge songs and video results
-        results = {**songs, **videos}
+        # Pick the best of the song and video results
+        results = [result for result in (best_song, best_video) if result is not None]
 
         # No matches found
         if not results:
             return None
 
-        result_items = list(results.items())
-
-        # Sort results by highest score
-        sorted_results = sorted(result_items, key=lambda x: x[1], reverse=True)
-
-        # Get the result with highest score
-        # and return the link
-        return sorted_results[0][0]
+        return max(results, key=lambda result: result[1])[0]
 
     def get_results(self, search_term: str, filter: str) -> List[Dict[str, Any]]:
         """
         Get results from YouTube Music API and simplify them
         """
 
-        results = self.client.search(search_term, filter=filter)
+        results = self._search(search_term, filter=filter)
 
         # Simplify results
         simplified_results = []
@@ -169,50 +186,43 @@ class YouTubeMusic(AudioProvider):
         song_artists: List[str],
         song_album_name: str,
         song_duration: int,
-    ) -> Dict[str, Any]:
+    ) -> Iterator[Tuple[str, float]]:
 
         # Slugify song title
         slug_song_title = slugify(create_song_title(song_name, song_artists))
         slug_song_name = slugify(song_name)
         slug_album_name = slugify(song_album_name)
+        slug_song_artists = [slugify(artist) for artist in song_artists]
+        # Words of the song name, used to skip results with no common words
+        sentence_words = set(slug_song_name.split("-"))
+        sentence_words.discard("")
 
         # Assign an overall avg match value to each result
-        links_with_match_value = {}
         for result in results:
-            # Slugify result title
+            # Slugify result title and artists
             slug_result_name = slugify(result["name"])
-
-            # check for common words in result name
-            sentence_words = slug_song_name.replace("-", " ").split(" ")
-            common_word = any(
-                word != "" and word in slug_result_name for word in sentence_words
-            )
+            slug_result_artists = slugify(result["artists"])
 
             # skip results that have no common words in their name
-            if not common_word:
+            if sentence_words.isdisjoint(slug_result_name.split("-")):
                 continue
 
             # Find artist match
-            artist_match_number = 0.0
             if result["type"] == "song":
-                for artist in song_artists:
-                    artist_match_number += match_percentage(
-                        slugify(artist), slugify(result["artists"])
-                    )
+                artist_match_number = total_match_percentage(
+                    slug_song_artists, slug_result_artists
+                )
             else:
-                for artist in song_artists:
-                    artist_match_number += match_percentage(
-                        slugify(artist), slugify(result["name"])
-                    )
+                artist_match_number = total_match_percentage(
+                    slug_song_artists, slug_result_name
+                )
 
                 # If we didn't find any artist match,
                 # we fallback to channel name match
                 if artist_match_number == 0:
-                    for artist in song_artists:
-                        artist_match_number += match_percentage(
-                            slugify(artist),
-                            slugify(result["artists"]),
-                        )
+                    artist_match_number = total_match_percentage(
+                        slug_song_artists, slug_result_artists
+                    )
 
             # skip results with artist match lower than 70%
             artist_match = artist_match_number / len(song_artists)
@@ -222,9 +232,9 @@ class YouTubeMusic(AudioProvider):
             # Calculate name match
             # for different result types
             if result["type"] == "song":
-                name_match = match_percentage(slugify(result["name"]), slug_song_name)
+                name_match = match_percentage(slug_result_name, slug_song_name)
             else:
-                name_match = match_percentage(slugify(result["name"]), slug_song_title)
+                name_match = match_percentage(slug_result_name, slug_song_title)
 
             # Drop results with name match lower than 50%
             if name_match < 50:
@@ -268,9 +278,7 @@ class YouTubeMusic(AudioProvider):
                 average_match = (artist_match + name_match + time_match) / 3
 
             # the results along with the avg Match
-            links_with_match_value[result["link"]] = average_match
-
-        return links_with_match_value
+            yield result["link"], average_match
 
     def add_progress_hook(self, hook: Callable) -> None:
         """
@@ -1,11 +1,15 @@
 from typing import List, Optional
 
+import requests
+
 
 class LyricsProvider:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         """
         Base class for all lyrics providers
         """
+        # Reuse the given session so connections are pooled between songs
+        self.session = session or requests.Session()
         self.headers = {
             "Connection": "keep-alive",
             "Pragma": "no-cache",
@@ -1,11 +1,50 @@
 from spotdl.providers.lyrics.base import LyricsProvider
-from typing import List, Optional
+from typing import Any, List, Optional
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-import requests
+import soupsieve
+
+# orjson is faster at parsing the genius api responses, but it's optional
+try:
+    from orjson import loads as json_loads  # pylint: disable=no-name-in-module
+except ImportError:
+    from json import loads as json_loads  # type: ignore
+
+# selectolax parses the genius lyrics pages much faster than html.parser,
+# but it's optional, BeautifulSoup is used when it's not installed
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None  # type: ignore
+
+LYRICS_DIV_SELECTOR = "div.lyrics"
+LYRICS_CONTAINER_SELECTOR = "div[class^=Lyrics__Container]"
+
+# Selectors are compiled once, instead of on every BeautifulSoup select call
+LYRICS_DIV = soupsieve.compile(LYRICS_DIV_SELECTOR)
+LYRICS_CONTAINER = soupsieve.compile(LYRICS_CONTAINER_SELECTOR)
 
 
 class Genius(LyricsProvider):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the Genius provider.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        # Keep connections to genius alive between songs
+        # and retry requests that failed because of transient errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount("https://api.genius.com", adapter)
+        self.session.mount("https://genius.com", adapter)
+
     def get_lyrics(self, name: str, artists: List[str]) -> Optional[str]:
         """
         Try to get lyrics from genius
@@ -21,7 +60,7 @@ class Genius(LyricsProvider):
             artist for artist in artists if artist.lower() not in name.lower()
         )
 
-        search_response = requests.get(
+        search_response = self.session.get(
             "https://api.genius.com/search",
             params={"q": f"{name} {artist_str}"},
             headers=headers,
@@ -29,30 +68,58 @@ class Genius(LyricsProvider):
         if not search_response.ok:
             return None
 
+        search_data = json_loads(search_response.content)
         try:
-            song_id = search_response.json()["response"]["hits"][0]["result"]["id"]
+            song_id = search_data["response"]["hits"][0]["result"]["id"]
         except (IndexError, KeyError):
             return None
 
-        song_response = requests.get(
+        song_response = self.session.get(
             f"https://api.genius.com/songs/{song_id}", headers=headers
         )
         if not song_response.ok:
             return None
 
-        song_url = song_response.json()["response"]["song"]["url"]
-        genius_page_response = requests.get(song_url, headers=headers)
+        song_url = json_loads(song_response.content)["response"]["song"]["url"]
+        genius_page_response = self.session.get(song_url, headers=headers)
         if not genius_page_response.ok:
             return None
 
-        soup = BeautifulSoup(
-            genius_page_response.text.replace("<br/>", "\n"), "html.parser"
-        )
-        lyrics_div = soup.select_one("div.lyrics")
+        page = genius_page_response.text.replace("<br/>", "\n")
+
+        return parse_lyrics(page)
+
+
+def parse_lyrics_soup(page: str) -> str:
+    """
+    Get the lyrics from a genius page with BeautifulSoup.
+    """
+
+    soup = BeautifulSoup(page, "html.parser")
+    lyrics_div = LYRICS_DIV.select_one(soup)
+
+    if lyrics_div is not None:
+        return lyrics_div.get_text().strip()
+
+    lyrics_containers = LYRICS_CONTAINER.select(soup)
+    lyrics = "\n".join(con.get_text() for con in lyrics_containers)
+    return lyrics.strip()
+
+
+def parse_lyrics_selectolax(page: str) -> str:
+    """
+    Get the lyrics from a genius page with selectolax.
+    """
+
+    tree = HTMLParser(page)
+    lyrics_node = tree.css_first(LYRICS_DIV_SELECTOR)
+
+    if lyrics_node is not None:
+        return lyrics_node.text().strip()
+
+    lyrics_nodes = tree.css(LYRICS_CONTAINER_SELECTOR)
+    lyrics = "\n".join(node.text() for node in lyrics_nodes)
+    return lyrics.strip()
 
-        if lyrics_div is not None:
-            return lyrics_div.get_text().strip()
 
-        lyrics_containers = soup.select("div[class^=Lyrics__Container]")
-        lyrics = "\n".join(con.get_text() for con in lyrics_containers)
-        return lyrics.strip()
+parse_lyrics = parse_lyrics_soup if HTMLParser is None else parse_lyrics_selectolax
@@ -1,12 +1,57 @@
 from spotdl.providers.lyrics.base import LyricsProvider
-from bs4 import BeautifulSoup
-from typing import List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Any, List, Optional
 from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-import requests
+import soupsieve
+
+# selectolax parses the musixmatch pages much faster than html.parser,
+# but it's optional, BeautifulSoup is used when it's not installed
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None  # type: ignore
+
+SONG_LINK_SELECTOR = "a[href^='/lyrics/']"
+LYRICS_SELECTOR = "p.mxm-lyrics__content"
+
+# Selectors are compiled once, instead of on every BeautifulSoup select call
+SONG_LINK = soupsieve.compile(SONG_LINK_SELECTOR)
+LYRICS = soupsieve.compile(LYRICS_SELECTOR)
+
+# Only the tags we need are parsed, the rest of the page is skipped
+SONG_LINK_STRAINER = SoupStrainer(
+    "a", href=lambda href: href is not None and href.startswith("/lyrics/")
+)
+LYRICS_STRAINER = SoupStrainer(
+    "p",
+    class_=lambda classes: classes is not None
+    and "mxm-lyrics__content" in classes.split(),
+)
 
 
 class MusixMatch(LyricsProvider):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the MusixMatch provider.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        # Keep connections to musixmatch alive between songs
+        # and retry requests that failed because of transient errors
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount("https://www.musixmatch.com", adapter)
+
+        # Headers are set once on the session instead of on every request
+        self.session.headers.update(self.headers)
+
     def get_lyrics(
         self, name: str, artists: List[str], track_search: bool = False
     ) -> Optional[str]:
@@ -27,17 +72,16 @@ class MusixMatch(LyricsProvider):
             query += "/tracks"
 
         search_url = f"https://www.musixmatch.com/search/{query}"
-        search_resp = requests.get(search_url, headers=self.headers)
+        search_resp = self.session.get(search_url)
         if not search_resp.ok:
             return None
 
-        search_soup = BeautifulSoup(search_resp.text, "html.parser")
-        song_url_tag = search_soup.select_one("a[href^='/lyrics/']")
+        song_href = parse_song_href(search_resp.text)
 
-        # song_url_tag being None means no results were found on the
+        # song_href being None means no results were found on the
         # All Results page, therefore, we use `track_search` to
         # search the tracks page.
-        if song_url_tag is None:
+        if song_href is None:
             # track_serach being True means we are already searching the tracks page.
             if track_search:
                 return None
@@ -45,13 +89,65 @@ class MusixMatch(LyricsProvider):
             lyrics = self.get_lyrics(name, artists, track_search=True)
             return lyrics
 
-        song_url = "https://www.musixmatch.com" + str(song_url_tag.get("href", ""))
-        lyrics_resp = requests.get(song_url, headers=self.headers)
+        song_url = "https://www.musixmatch.com" + song_href
+        lyrics_resp = self.session.get(song_url)
         if not lyrics_resp.ok:
             return None
 
-        lyrics_soup = BeautifulSoup(lyrics_resp.text, "html.parser")
-        lyrics_paragraphs = lyrics_soup.select("p.mxm-lyrics__content")
-        lyrics = "\n".join(i.get_text() for i in lyrics_paragraphs)
+        return parse_lyrics(lyrics_resp.text)
+
+
+def parse_song_href_soup(page: str) -> Optional[str]:
+    """
+    Get the link of the first song from a musixmatch search page
+    with BeautifulSoup.
+    """
+
+    search_soup = BeautifulSoup(page, "html.parser", parse_only=SONG_LINK_STRAINER)
+    song_url_tag = SONG_LINK.select_one(search_soup)
+    if song_url_tag is None:
+        return None
+
+    return str(song_url_tag.get("href", ""))
+
+
+def parse_song_href_selectolax(page: str) -> Optional[str]:
+    """
+    Get the link of the first song from a musixmatch search page
+    with selectolax.
+    """
+
+    song_url_node = HTMLParser(page).css_first(SONG_LINK_SELECTOR)
+    if song_url_node is None:
+        return None
+
+    return song_url_node.attributes.get("href") or ""
+
+
+def parse_lyrics_soup(page: str) -> str:
+    """
+    Get the lyrics from a musixmatch lyrics page with BeautifulSoup.
+    """
+
+    lyrics_soup = BeautifulSoup(page, "html.parser", parse_only=LYRICS_STRAINER)
+    lyrics_paragraphs = LYRICS.select(lyrics_soup)
+
+    return "\n".join(i.get_text() for i in lyrics_paragraphs)
+
+
+def parse_lyrics_selectolax(page: str) -> str:
+    """
+    Get the lyrics from a musixmatch lyrics page with selectolax.
+    """
+
+    lyrics_nodes = HTMLParser(page).css(LYRICS_SELECTOR)
+
+    return "\n".join(node.text() for node in lyrics_nodes)
+
 
-        return lyrics
+if HTMLParser is None:
+    parse_song_href = parse_song_href_soup
+    parse_lyrics = parse_lyrics_soup
+else:
+    parse_song_href = parse_song_href_selectolax
+    parse_lyrics = parse_lyrics_selectolax
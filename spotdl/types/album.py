@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import SpotifyClient, fetch_remaining_pages
 from spotdl.types.song import Song
+from spotdl.types.frozen import FrozenSlots
 
 
 class AlbumError(Exception):
@@ -11,16 +12,19 @@ class AlbumError(Exception):
 
 
 @dataclass(frozen=True)
-class Album:
+class Album(FrozenSlots):
+    __slots__ = ("name", "url", "tracks", "artist")
+
     name: str
     url: str
     tracks: List[Song]
     artist: Dict[str, Any]
 
     @classmethod
-    def from_url(cls, url: str) -> "Album":
+    def from_url(cls, url: str, threads: int = 4) -> "Album":
         """
         Parse an album from a Spotify URL.
+        Songs are fetched using `threads` threads.
         """
 
         spotify_client = SpotifyClient()
@@ -35,7 +39,7 @@ class Album:
 
         # Remove songs without id (country restricted/local tracks)
         # And create song object for each track
-        songs: List[Song] = [Song.from_url(url) for url in urls]
+        songs: List[Song] = Song.list_from_urls(urls, threads)
 
         return cls(
             name=album_metadata["name"],
@@ -68,18 +72,18 @@ class Album:
 
         tracks = album_response["items"]
 
-        # Get all tracks from album
-        while album_response["next"]:
-            album_response = spotify_client.next(album_response)
-
-            # Failed to get response, break the loop
-            if album_response is None:
-                break
-
-            tracks.extend(album_response["items"])
-
-        if album_response is None:
-            raise AlbumError(f"Failed to get album response: {url}")
+        # Get all tracks from album, the remaining pages are fetched concurrently
+        for page in fetch_remaining_pages(
+            album_response,
+            lambda offset: spotify_client.album_tracks(
+                url, limit=album_response["limit"], offset=offset
+            ),
+        ):
+            # Failed to get response
+            if page is None:
+                raise AlbumError(f"Failed to get album response: {url}")
+
+            tracks.extend(page["items"])
 
         return [
             track["external_urls"]["spotify"]
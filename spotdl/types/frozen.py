@@ -0,0 +1,19 @@
+from typing import Any, Dict, Tuple
+
+
+class FrozenSlots:
+    """
+    Base class for frozen dataclasses that declare `__slots__` by hand,
+    `dataclass(slots=True)` requires python 3.10. Without a `__dict__`,
+    unpickling and deep copying would set the fields through the frozen
+    `__setattr__`, so the state is restored with `object.__setattr__`.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
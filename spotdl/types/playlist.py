@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import List
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.utils.spotify import SpotifyClient, fetch_remaining_pages
 from spotdl.types.song import Song
+from spotdl.types.frozen import FrozenSlots
 
 
 class PlaylistError(Exception):
@@ -11,7 +12,9 @@ class PlaylistError(Exception):
 
 
 @dataclass(frozen=True)
-class Playlist:
+class Playlist(FrozenSlots):
+    __slots__ = ("name", "url", "tracks", "description", "author_url", "author_name")
+
     name: str
     url: str
     tracks: List[Song]
@@ -20,9 +23,10 @@ class Playlist:
     author_name: str
 
     @classmethod
-    def from_url(cls, url: str) -> "Playlist":
+    def from_url(cls, url: str, threads: int = 4) -> "Playlist":
         """
         Load playlist info and tracks from a Spotify playlist URL.
+        Songs are fetched using `threads` threads.
         """
         spotify_client = SpotifyClient()
 
@@ -35,7 +39,7 @@ class Playlist:
 
         # Remove songs without id (country restricted/local tracks)
         # And create song object for each track
-        tracks = [Song.from_url(url) for url in urls]
+        tracks = Song.list_from_urls(urls, threads)
 
         return cls(
             name=playlist["name"],
@@ -71,16 +75,19 @@ class Playlist:
 
         tracks = playlist_response["items"]
 
-        # Get all tracks from playlist
-        while playlist_response["next"]:
-            playlist_response = spotify_client.next(playlist_response)
-
+        # Get all tracks from playlist, the remaining pages are fetched concurrently
+        for page in fetch_remaining_pages(
+            playlist_response,
+            lambda offset: spotify_client.playlist_items(
+                url, limit=playlist_response["limit"], offset=offset
+            ),
+        ):
             # Failed to get response, break the loop
-            if playlist_response is None:
+            if page is None:
                 break
 
             # Add tracks to the list
-            tracks.extend(playlist_response["items"])
+            tracks.extend(page["items"])
 
         return [
             track["track"]["external_urls"]["spotify"]
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import List
 from spotdl.types.song import Song
-from spotdl.utils.spotify import SpotifyClient
+from spotdl.types.frozen import FrozenSlots
+from spotdl.utils.spotify import SpotifyClient, fetch_remaining_pages
 
 
 class SavedError(Exception):
@@ -11,21 +12,24 @@ class SavedError(Exception):
 
 
 @dataclass(frozen=True)
-class Saved:
+class Saved(FrozenSlots):
+    __slots__ = ("tracks",)
+
     tracks: List[Song]
 
     @classmethod
-    def load(cls):
+    def load(cls, threads: int = 4):
         """
         Loads saved tracks from Spotify.
         Will throw an exception if users is not logged in.
+        Songs are fetched using `threads` threads.
         """
 
         urls = cls.get_urls()
 
         # Remove songs without id
         # and create Song objects
-        tracks = [Song.from_url(url) for url in urls]
+        tracks = Song.list_from_urls(urls, threads)
 
         return cls(tracks)
 
@@ -39,21 +43,25 @@ class Saved:
         if spotify_client.user_auth is False:  # type: ignore
             raise SavedError("You must be logged in to use this function.")
 
-        saved_tracks_response = spotify_client.current_user_saved_tracks()
+        # 50 is the maximum page size of this endpoint, the default is 20
+        saved_tracks_response = spotify_client.current_user_saved_tracks(limit=50)
         if saved_tracks_response is None:
             raise Exception("Couldn't get saved tracks")
 
         saved_tracks = saved_tracks_response["items"]
 
-        # Fetch all saved tracks
-        while saved_tracks_response and saved_tracks_response["next"]:
-            response = spotify_client.next(saved_tracks_response)
+        # Fetch all saved tracks, the remaining pages are fetched concurrently
+        for page in fetch_remaining_pages(
+            saved_tracks_response,
+            lambda offset: spotify_client.current_user_saved_tracks(
+                limit=saved_tracks_response["limit"], offset=offset
+            ),
+        ):
             # response is wrong, break
-            if response is None:
+            if page is None:
                 break
 
-            saved_tracks_response = response
-            saved_tracks.extend(saved_tracks_response["items"])
+            saved_tracks.extend(page["items"])
 
         # Remove songs without id
         # and return urls
@@ -1,4 +1,5 @@
 import json
+import concurrent.futures
 
 from dataclasses import dataclass, asdict
 from typing import Dict, Any, List, Optional
@@ -93,6 +94,16 @@ class Song:
             cover_url=raw_album_meta["images"][0]["url"],
         )
 
+    @classmethod
+    def list_from_urls(cls, urls: List[str], threads: int = 4) -> List["Song"]:
+        """
+        Creates a list of Song objects from a list of URLs.
+        Songs are fetched concurrently, the order of the URLs is kept.
+        """
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(cls.from_url, urls))
+
     @classmethod
     def from_search_term(cls, search_term: str) -> "Song":
         """
@@ -1,22 +1,37 @@
 import sys
 
-from argparse import ArgumentParser, Namespace
-
-from yt_dlp.cookies import SUPPORTED_BROWSERS
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 
 from spotdl import _version
 from spotdl.utils.ffmpeg import FFMPEG_FORMATS
 from spotdl.utils.config import DEFAULT_CONFIG
-from spotdl.download.downloader import (
-    AUDIO_PROVIDERS,
-    LYRICS_PROVIDERS,
-    PROGRESS_HANDLERS,
+from spotdl.download.registry import (
+    _AUDIO_PROVIDER_SPECS,
+    _LYRICS_PROVIDER_SPECS,
+    _PROGRESS_HANDLER_SPECS,
 )
 
 
 OPERATIONS = ["download", "save", "preload", "web"]
 
 
+def browser(value: str) -> str:
+    """
+    Check that the browser is supported by yt-dlp. yt-dlp is only
+    imported when a browser is passed, it's slow to import.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from yt_dlp.cookies import SUPPORTED_BROWSERS
+
+    if value not in SUPPORTED_BROWSERS:
+        raise ArgumentTypeError(
+            f"invalid choice: {value!r} (choose from {', '.join(SUPPORTED_BROWSERS)})"
+        )
+
+    return value
+
+
 def parse_arguments() -> Namespace:
     """
     Parse arguments from the command line.
@@ -72,7 +87,7 @@ def parse_main_options(parser: ArgumentParser) -> ArgumentParser:
         "--audio",
         "-a",
         dest="audio_provider",
-        choices=AUDIO_PROVIDERS.keys(),
+        choices=_AUDIO_PROVIDER_SPECS.keys(),
         default=DEFAULT_CONFIG["audio_provider"],
         help="The audio provider to use.",
     )
@@ -82,7 +97,7 @@ def parse_main_options(parser: ArgumentParser) -> ArgumentParser:
         "--lyrics",
         "-l",
         dest="lyrics_provider",
-        choices=LYRICS_PROVIDERS.keys(),
+        choices=_LYRICS_PROVIDER_SPECS.keys(),
         default=DEFAULT_CONFIG["lyrics_provider"],
         help="The lyrics provider to use.",
     )
@@ -98,7 +113,7 @@ def parse_main_options(parser: ArgumentParser) -> ArgumentParser:
     # Add progress handler type argument
     parser.add_argument(
         "--progress-handler",
-        choices=PROGRESS_HANDLERS.keys(),
+        choices=_PROGRESS_HANDLER_SPECS.keys(),
         dest="progress_handler",
         default=DEFAULT_CONFIG["progress_handler"],
         help="The progress handler to use.",
@@ -147,7 +162,7 @@ def parse_spotify_options(parser: ArgumentParser) -> ArgumentParser:
         "--browsers",
         nargs="*",
         default=DEFAULT_CONFIG["browsers"],
-        choices=SUPPORTED_BROWSERS,
+        type=browser,
         help="The browsers used when getting cookies",
     )
 
@@ -48,6 +48,13 @@ def get_temp_path() -> Path:
     return temp_path
 
 
+def get_search_cache_path() -> Path:
+    """
+    Returns the path to the search cache database.
+    """
+    return get_temp_path() / "search_cache.sqlite"
+
+
 def get_errors_path() -> Path:
     """
     Returns the path to the spotdl errors folder.
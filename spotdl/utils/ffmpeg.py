@@ -37,6 +37,8 @@ FFMPEG_FORMATS = {
     "m4a": ["-codec:a", "aac", "-vn"],
 }
 
+DEFAULT_FFMPEG_ARGS = ["-abr", "true", "-v", "debug"]
+
 
 class FFmpegError(Exception):
     """
@@ -205,9 +207,7 @@ class FFmpeg:
         self.output_format = output_format
         self.variable_bitrate = variable_bitrate
         self.constant_bitrate = constant_bitrate
-        self.ffmpeg_args = (
-            ["-abr", "true", "-v", "debug"] if ffmpeg_args is None else ffmpeg_args
-        )
+        self.ffmpeg_args = DEFAULT_FFMPEG_ARGS if ffmpeg_args is None else ffmpeg_args
 
     async def convert(
         self,
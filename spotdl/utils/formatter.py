@@ -1,9 +1,21 @@
 import re
+import functools
 
 from typing import List, Optional
 from pathlib import Path
 from spotdl.types import Song
 
+# Characters that are not allowed in file names on windows are removed,
+# double quotes (") and colons (:) are replaced with their equivalents
+_BAD_TABLE = str.maketrans('":', "'-", "/?\\*|<>")
+
+# Matches anything that looks like a template variable, e.g. "{artists}",
+# the variables themselves are the keys of `formats` in create_file_name
+_TEMPLATE_RE = re.compile(r"\{[a-z-]+\}")
+
+# Strips leading and trailing dots from the parts of a path
+_SANITIZE_PART_RE = re.compile(r"[^\.*](.*)[^\.*$]")
+
 
 def create_song_title(song_name: str, song_artists: List[str]) -> str:
     """
@@ -22,16 +34,8 @@ def sanitize_string(string: str) -> str:
     Sanitize the filename to be used in the file system.
     """
 
-    output = string
-
-    # this is windows specific (disallowed chars)
-    output = "".join(char for char in output if char not in "/?\\*|<>")
-
-    # double quotes (") and semi-colons (:) are also disallowed characters but we would
-    # like to retain their equivalents, so they aren't removed in the prior loop
-    output = output.replace('"', "'").replace(":", "-")
-
-    return output
+    # this is windows specific (disallowed chars), done in a single pass
+    return string.translate(_BAD_TABLE)
 
 
 def create_file_name(
@@ -65,7 +69,7 @@ def create_file_name(
 
     # If template does not contain any of the keys,
     # append {artists} - {title}.{output-ext} to it
-    if not any(key in template for key in formats):
+    if not any(match.group(0) in formats for match in _TEMPLATE_RE.finditer(template)):
         template += "/{artists} - {title}.{output-ext}"
 
     # If template ends with a slash. Does not have a file name with extension
@@ -77,20 +81,23 @@ def create_file_name(
     if not template.endswith(".{output-ext}"):
         template += ".{output-ext}"
 
-    # sanitize the values in formats dict
-    for key, value in formats.items():
-        formats[key] = sanitize_string(str(value))
+    def replace_variable(match: "re.Match[str]") -> str:
+        key = match.group(0)
+        if key not in formats:
+            return key
 
-    # Replace all the keys with the values
-    for key, value in formats.items():
-        template = template.replace(key, str(value))
+        return sanitize_string(str(formats[key]))
+
+    # Replace all the keys with the sanitized values in a single pass,
+    # unknown variables are left as they are
+    template = _TEMPLATE_RE.sub(replace_variable, template)
 
     # Parse template as Path object
     file = Path(template)
 
     santitized_parts = []
     for part in file.parts:
-        match = re.search(r"[^\.*](.*)[^\.*$]", part)
+        match = _SANITIZE_PART_RE.search(part)
         if match:
             santitized_parts.append(match.group(0))
         else:
@@ -111,9 +118,20 @@ def parse_duration(duration: Optional[str]) -> float:
     Convert string value of time (duration: "25:36:59") to a float value of seconds (92219.0)
     """
 
-    if duration is None:
+    # Only strings can be parsed (and cached), anything else is a wrong value
+    if not isinstance(duration, str):
         return 0.0
 
+    return _parse_duration(duration)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_duration(duration: str) -> float:
+    """
+    Parse the duration string, durations repeat a lot between results
+    so they are cached.
+    """
+
     try:
         # {(1, "s"), (60, "m"), (3600, "h")}
         mapped_increments = zip([1, 60, 3600], reversed(duration.split(":")))
@@ -121,5 +139,5 @@ def parse_duration(duration: Optional[str]) -> float:
         return float(seconds)
 
     # This usually occurs when the wrong string is mistaken for the duration
-    except (ValueError, TypeError, AttributeError):
+    except ValueError:
         return 0.0
@@ -1,8 +1,12 @@
+import os
 import base64
+import functools
 
 from pathlib import Path
-from urllib.request import urlopen
 
+import requests
+
+from requests.adapters import HTTPAdapter
 from mutagen.oggopus import OggOpus
 from mutagen.mp4 import MP4, MP4Cover
 from mutagen.flac import Picture, FLAC
@@ -40,9 +44,50 @@ M4A_TAG_PRESET = {
 
 TAG_PRESET = {key: key for key in M4A_TAG_PRESET}
 
+# Covers are downloaded with a single session, so connections
+# to the image server are reused between songs
+_cover_session = requests.Session()
+_cover_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def _fspath(path: Path) -> str:
+    """
+    Get the path as a string, only relative paths are resolved
+    since resolving the path stats every directory in it.
+    """
+
+    return os.fspath(path if path.is_absolute() else path.resolve())
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_cover(url: str) -> bytes:
+    """
+    Download the cover art, songs from the same album share the same
+    cover url so it's only downloaded once.
+    """
+
+    response = _cover_session.get(url, timeout=10)
+    response.raise_for_status()
+
+    return response.content
+
+
+def prefetch_cover(song: Song) -> None:
+    """
+    Download the cover art of the song into the cover cache, so it can be
+    downloaded while the song is downloaded instead of when it's embedded.
+    Errors are ignored here, they are raised again when embedding the cover.
+    """
+
+    if song.cover_url:
+        try:
+            _fetch_cover(song.cover_url)
+        except Exception:  # pylint: disable=broad-except
+            pass
+
 
 def _set_id3_mp3(output_file: Path, song: Song, lyrics: str = ""):
-    audio_file = EasyID3(str(output_file.resolve()))
+    audio_file = EasyID3(_fspath(output_file))
 
     audio_file = _embed_mp3_metadata(audio_file, song)
     audio_file.save(v2_version=3)
@@ -54,7 +99,7 @@ def _set_id3_mp3(output_file: Path, song: Song, lyrics: str = ""):
 
 
 def _set_id3_m4a(output_file: Path, song: Song, lyrics: str = ""):
-    audio_file = MP4(str(output_file.resolve()))
+    audio_file = MP4(_fspath(output_file))
 
     audio_file = _embed_basic_metadata(audio_file, song, "m4a", M4A_TAG_PRESET)
     audio_file = _embed_m4a_metadata(audio_file, song, lyrics)
@@ -63,7 +108,7 @@ def _set_id3_m4a(output_file: Path, song: Song, lyrics: str = ""):
 
 
 def _set_id3_flac(output_file: Path, song: Song, lyrics: str = ""):
-    audio_file = FLAC(str(output_file.resolve()))
+    audio_file = FLAC(_fspath(output_file))
 
     audio_file = _embed_basic_metadata(audio_file, song, "flac")
     audio_file = _embed_ogg_metadata(audio_file, song, lyrics)
@@ -73,7 +118,7 @@ def _set_id3_flac(output_file: Path, song: Song, lyrics: str = ""):
 
 
 def _set_id3_opus(output_file: Path, song: Song, lyrics: str = ""):
-    audio_file = OggOpus(str(output_file.resolve()))
+    audio_file = OggOpus(_fspath(output_file))
 
     audio_file = _embed_basic_metadata(audio_file, song, "opus")
     audio_file = _embed_ogg_metadata(audio_file, song, lyrics)
@@ -83,7 +128,7 @@ def _set_id3_opus(output_file: Path, song: Song, lyrics: str = ""):
 
 
 def _set_id3_ogg(output_file: Path, song: Song, lyrics: str = ""):
-    audio_file = OggVorbis(str(output_file.resolve()))
+    audio_file = OggVorbis(_fspath(output_file))
 
     audio_file = _embed_basic_metadata(audio_file, song, "ogg")
     audio_file = _embed_ogg_metadata(audio_file, song, lyrics)
@@ -117,14 +162,13 @@ def _embed_mp3_metadata(audio_file, song: Song):
 def _embed_mp3_cover(file_path, song: Song):
     audio_file = ID3(file_path)
     if song.cover_url:
-        with urlopen(song.cover_url) as raw_album_art:
-            audio_file["APIC"] = AlbumCover(
-                encoding=3,
-                mime="image/jpeg",
-                type=3,
-                desc="Cover",
-                data=raw_album_art.read(),
-            )
+        audio_file["APIC"] = AlbumCover(
+            encoding=3,
+            mime="image/jpeg",
+            type=3,
+            desc="Cover",
+            data=_fetch_cover(song.cover_url),
+        )
 
     return audio_file
 
@@ -143,13 +187,12 @@ def _embed_m4a_metadata(audio_file, song: Song, lyrics: str = ""):
 
     if song.cover_url:
         try:
-            with urlopen(song.cover_url) as raw_album_art:
-                audio_file[M4A_TAG_PRESET["albumart"]] = [
-                    MP4Cover(
-                        raw_album_art.read(),
-                        imageformat=MP4Cover.FORMAT_JPEG,
-                    )
-                ]
+            audio_file[M4A_TAG_PRESET["albumart"]] = [
+                MP4Cover(
+                    _fetch_cover(song.cover_url),
+                    imageformat=MP4Cover.FORMAT_JPEG,
+                )
+            ]
         except IndexError:
             pass
 
@@ -203,8 +246,7 @@ def _embed_cover(audio_file, song: Song, encoding: str):
     image.desc = "Cover"
     image.mime = "image/jpeg"
 
-    with urlopen(song.cover_url) as raw_album_art:
-        image.data = raw_album_art.read()
+    image.data = _fetch_cover(song.cover_url)
 
     if encoding == "flac":
         audio_file.add_picture(image)
@@ -231,8 +273,7 @@ def embed_metadata(
 ) -> None:
     """
     Embeds metadata into the output file.
+    Raises KeyError if the file format isn't supported.
     """
 
-    function = AVAILABLE_FORMATS.get(file_format)
-    if function:
-        function(output_file, song, lyrics)
+    AVAILABLE_FORMATS[file_format](output_file, song, lyrics)
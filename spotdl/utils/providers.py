@@ -1,6 +1,18 @@
-from rapidfuzz import fuzz
+import functools
+
+from typing import Iterable, List, Optional, Tuple
+
+from rapidfuzz import fuzz, process
 from slugify.main import Slugify
 
+# Slugified strings are cached, the same titles and artists
+# show up in the results of many songs
+slugify = functools.lru_cache(maxsize=8192)(Slugify(to_lower=True))
+
+# Minimum score of the best isrc search result to use it
+# without searching for the song title
+ISRC_MATCH_THRESHOLD = 85
+
 
 def match_percentage(str1: str, str2: str, score_cutoff: float = 0) -> float:
     """
@@ -13,7 +25,40 @@ def match_percentage(str1: str, str2: str, score_cutoff: float = 0) -> float:
 
     # On error, use slugify to handle unicode characters
     except Exception:  # pylint: disable=broad-except
-        slugify = Slugify(to_lower=True)
         return fuzz.partial_ratio(
             str1, str2, score_cutoff=score_cutoff, processor=slugify
         )
+
+
+def total_match_percentage(strings: List[str], str2: str) -> float:
+    """
+    Sum of `match_percentage` of every string in `strings` against `str2`.
+    All strings are scored in a single rapidfuzz call, the strings
+    are expected to be already normalized with slugify.
+    """
+
+    matches = process.extract(
+        str2, strings, scorer=fuzz.partial_ratio, processor=None, limit=None
+    )
+
+    return sum(score for _, score, _ in matches)
+
+
+def best_result(
+    results: Iterable[Tuple[str, float]], threshold: float = 95
+) -> Optional[Tuple[str, float]]:
+    """
+    Get the (link, score) pair with the highest score.
+    Stops consuming the results as soon as a score reaches the threshold,
+    so the remaining results don't have to be scored.
+    """
+
+    best = None
+    for link, score in results:
+        if best is None or score > best[1]:
+            best = (link, score)
+
+        if score >= threshold:
+            break
+
+    return best
@@ -1,7 +1,6 @@
 import json
-import concurrent.futures
 
-from typing import List
+from typing import Any, List, Set
 
 from spotdl.types import Song, Playlist, Album, Artist, Saved
 
@@ -66,8 +65,26 @@ def parse_query(
         else:
             songs.append(Song.from_search_term(request))
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-        for song in executor.map(Song.from_url, urls):
-            songs.append(song)
+    songs.extend(Song.list_from_urls(urls, threads))
 
     return songs
+
+
+def deduplicate_songs(songs: List[Song]) -> List[Song]:
+    """
+    Remove duplicate songs from the list, keeping the first occurrence.
+    Songs are compared by their url, or by name, artist and duration
+    if the url is missing.
+    """
+
+    seen: Set[Any] = set()
+    unique_songs: List[Song] = []
+    for song in songs:
+        key = song.url or (song.name, song.artist, song.duration)
+        if key in seen:
+            continue
+
+        seen.add(key)
+        unique_songs.append(song)
+
+    return unique_songs
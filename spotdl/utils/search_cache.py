@@ -0,0 +1,96 @@
+import time
+import sqlite3
+import threading
+
+from pathlib import Path
+from typing import Optional
+
+from spotdl.utils.config import get_search_cache_path
+
+# Cached search results are valid for 30 days
+SEARCH_CACHE_TTL = 30 * 24 * 60 * 60
+
+
+class SearchCache:
+    """
+    Persistent cache of audio provider search results.
+    Maps a song url and audio provider to the found download url.
+    The database is opened on first use and can be used from any thread.
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, ttl: int = SEARCH_CACHE_TTL
+    ) -> None:
+        """
+        Initialize the cache, the database is opened when it's first used.
+        """
+
+        self.path = get_search_cache_path() if path is None else path
+        self.ttl = ttl
+        self.connection: Optional[sqlite3.Connection] = None
+
+        # Searches run in different threads, the connection is shared
+        # between them so every use of it is guarded by the lock
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the database connection, opening the database and creating
+        the table if it's not open yet. Has to be called with the lock held.
+        """
+
+        if self.connection is None:
+            self.connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS search ("
+                "song_url TEXT, provider TEXT, url TEXT, ts INTEGER, "
+                "PRIMARY KEY (song_url, provider))"
+            )
+            self.connection.commit()
+
+        return self.connection
+
+    def get(self, song_url: str, provider: str) -> Optional[str]:
+        """
+        Get the cached download url for a song.
+        Returns None if the song is not cached or the entry has expired.
+        """
+
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT url, ts FROM search WHERE song_url = ? AND provider = ?",
+                    (song_url, provider),
+                )
+                .fetchone()
+            )
+
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+
+        return row[0]
+
+    def set(self, song_url: str, provider: str, url: str) -> None:
+        """
+        Save the download url for a song.
+        """
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO search (song_url, provider, url, ts) "
+                "VALUES (?, ?, ?, ?)",
+                (song_url, provider, url, int(time.time())),
+            )
+            connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the cache database, it's opened again if the cache is used.
+        """
+
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
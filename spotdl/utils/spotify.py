@@ -1,3 +1,11 @@
+import threading
+import concurrent.futures
+
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from requests.adapters import HTTPAdapter
 from spotipy import Spotify
 from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
@@ -18,6 +26,7 @@ class Singleton(type):
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __call__(self):
         if self._instance is None:
@@ -37,36 +46,38 @@ class Singleton(type):
         Initializes the SpotifyClient.
         """
 
-        # check if initialization has been completed, if yes, raise an Exception
-        if isinstance(self._instance, self):
-            raise SpotifyError("A spotify client has already been initialized")
+        # Initialization is locked, so threads can't create two clients
+        with self._lock:
+            # check if initialization has been completed, if yes, raise an Exception
+            if self._instance is not None:
+                raise SpotifyError("A spotify client has already been initialized")
 
-        credential_manager = None
+            credential_manager = None
 
-        # Use SpotifyOAuth as auth manager
-        if user_auth:
-            credential_manager = SpotifyOAuth(
-                client_id=client_id,
-                client_secret=client_secret,
-                redirect_uri="http://127.0.0.1:8080/",
-                scope="user-library-read",
-                cache_handler=CacheFileHandler(get_cache_path()),
-            )
-        # Use SpotifyClientCredentials as auth manager
-        else:
-            credential_manager = SpotifyClientCredentials(
-                client_id=client_id,
-                client_secret=client_secret,
-                cache_handler=CacheFileHandler(get_cache_path()),
-            )
+            # Use SpotifyOAuth as auth manager
+            if user_auth:
+                credential_manager = SpotifyOAuth(
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    redirect_uri="http://127.0.0.1:8080/",
+                    scope="user-library-read",
+                    cache_handler=CacheFileHandler(get_cache_path()),
+                )
+            # Use SpotifyClientCredentials as auth manager
+            else:
+                credential_manager = SpotifyClientCredentials(
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    cache_handler=CacheFileHandler(get_cache_path()),
+                )
 
-        self.user_auth = user_auth
+            self.user_auth = user_auth
 
-        # Create instance
-        self._instance = super().__call__(auth_manager=credential_manager)
+            # Create instance
+            self._instance = super().__call__(auth_manager=credential_manager)
 
-        # Return instance
-        return self._instance
+            # Return instance
+            return self._instance
 
 
 class SpotifyClient(Spotify, metaclass=Singleton):
@@ -79,4 +90,34 @@ class SpotifyClient(Spotify, metaclass=Singleton):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+
+        # Pages and tracks are fetched concurrently, so the connection pool is
+        # made larger than the default of 10, spotipy's retry settings are kept
+        if isinstance(self._session, requests.Session):
+            adapter = HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=self._session.get_adapter("https://").max_retries,
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
         self._initialized = True
+
+
+def fetch_remaining_pages(
+    response: Dict[str, Any],
+    fetch_page: Callable[[int], Optional[Dict[str, Any]]],
+    threads: int = 4,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Fetch all pages after the first page of a Spotify paging object.
+    `fetch_page` is called with the offset of every remaining page, pages
+    are fetched concurrently and returned in order. Failed pages are None.
+    """
+
+    limit = response["limit"]
+    offsets = range(response["offset"] + limit, response["total"], limit)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(fetch_page, offsets))
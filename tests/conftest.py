@@ -1,5 +1,7 @@
+import gzip
 import pytest
 import asyncio
+import yaml
 
 from pathlib import Path
 
@@ -55,3 +57,21 @@ def patch_dependencies(monkeypatch):
     monkeypatch.setattr(
         asyncio.subprocess, "create_subprocess_exec", fake_create_subprocess_exec
     )
+
+
+@pytest.fixture()
+def cassette_page(request):
+    """
+    Return the decoded body of a response recorded in a cassette
+    next to the test module.
+    """
+
+    def load(cassette, index):
+        path = Path(request.fspath).parent / "cassettes" / f"{cassette}.yaml"
+        with open(path, encoding="utf-8") as cassette_file:
+            interactions = yaml.safe_load(cassette_file)["interactions"]
+
+        body = interactions[index]["response"]["body"]["string"]
+        return gzip.decompress(body).decode("utf-8")
+
+    return load
@@ -1,12 +1,33 @@
 import pytest
 
-from spotdl.providers.lyrics.genius import Genius
+from spotdl.providers.lyrics.genius import (
+    HTMLParser,
+    Genius,
+    parse_lyrics_selectolax,
+    parse_lyrics_soup,
+)
 
 lyrics = "[Verse 1]\nMore than lovers\nDestined to find, one another\nLike lightning and thunder\nCan't have one without the other (woah)\n\n[Chorus]\nIt was written in the stars\nOh, we can't be torn apart\nWe are linked together\nForged in fire forever\nWe are linked together, together\n\n[Beat-Bass]\n\n\n[Verse 2]\nPast the rings of Saturn\nAcross the Milky Way\nWhere it's raining diamonds\nWe'll return someday\nSpeaking life of words\nIn perfect harmony\nI'll run away with you to another galaxy\n\n[Chorus]\nIt was written in the stars\nOh, we can't be torn apart\nWe are linked together\nForged in fire forever\nWe are linked together, together\n\n[Beat-Bass]\n\nWe are linked, together\nWe are linked, together\nWe are linked, together\nWe are linked, together\n(oh, Woah)"
 
 
+def requires_selectolax(parser):
+    return pytest.param(
+        parser,
+        marks=pytest.mark.skipif(HTMLParser is None, reason="selectolax not installed"),
+    )
+
+
 @pytest.mark.vcr()
 def test_get_genius_lyrics():
     genius = Genius()
 
     assert genius.get_lyrics("Linked", ["Jim Yosef"]) == lyrics
+
+
+@pytest.mark.parametrize(
+    "parser", [parse_lyrics_soup, requires_selectolax(parse_lyrics_selectolax)]
+)
+def test_parse_genius_lyrics(parser, cassette_page):
+    page = cassette_page("test_get_genius_lyrics", 2).replace("<br/>", "\n")
+
+    assert parser(page) == lyrics
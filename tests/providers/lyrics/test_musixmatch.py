@@ -1,12 +1,44 @@
 import pytest
 
-from spotdl.providers.lyrics.musixmatch import MusixMatch
+from spotdl.providers.lyrics.musixmatch import (
+    HTMLParser,
+    MusixMatch,
+    parse_lyrics_selectolax,
+    parse_lyrics_soup,
+    parse_song_href_selectolax,
+    parse_song_href_soup,
+)
 
 lyrics = "Stranded in the open\nDried out tears of sorrow\nLacking all emotion\nStaring down the barrel waiting for the\nFinal gates to open\nTo a new tomorrow\nMoving with the motion\nFollowing the light that sets me free\n\nSets me free"
 
 
+def requires_selectolax(parser):
+    return pytest.param(
+        parser,
+        marks=pytest.mark.skipif(HTMLParser is None, reason="selectolax not installed"),
+    )
+
+
 @pytest.mark.vcr()
 def test_get_musixmatch_lyrics():
     musixmatch = MusixMatch()
 
     assert musixmatch.get_lyrics("Mortals", ["Warriyo"]) == lyrics
+
+
+@pytest.mark.parametrize(
+    "parser", [parse_song_href_soup, requires_selectolax(parse_song_href_selectolax)]
+)
+def test_parse_musixmatch_song_href(parser, cassette_page):
+    page = cassette_page("test_get_musixmatch_lyrics", 0)
+
+    assert parser(page) == "/lyrics/Warriyo-feat-Laura-Brehm/Mortals"
+
+
+@pytest.mark.parametrize(
+    "parser", [parse_lyrics_soup, requires_selectolax(parse_lyrics_selectolax)]
+)
+def test_parse_musixmatch_lyrics(parser, cassette_page):
+    page = cassette_page("test_get_musixmatch_lyrics", 1)
+
+    assert parser(page) == lyrics
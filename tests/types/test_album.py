@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from spotdl.types.album import Album
@@ -36,6 +39,17 @@ def test_album_wrong_init():
         )  # type: ignore
 
 
+def test_album_copy():
+    """
+    Test if Album survives pickling and deep copying.
+    """
+
+    album = Album(name="test", url="test", tracks=[], artist={"name": "test"})
+
+    assert pickle.loads(pickle.dumps(album)) == album
+    assert copy.deepcopy(album) == album
+
+
 @pytest.mark.vcr()
 def test_album_from_url():
     """
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 from spotdl.types.playlist import Playlist
 from spotdl.utils.spotify import SpotifyClient
 
@@ -52,6 +55,24 @@ def test_playlist_wrong_init():
         )  # type: ignore
 
 
+def test_playlist_copy():
+    """
+    Tests if Playlist survives pickling and deep copying.
+    """
+
+    playlist = Playlist(
+        name="test",
+        url="test",
+        tracks=[],
+        description="test",
+        author_url="test",
+        author_name="test",
+    )
+
+    assert pickle.loads(pickle.dumps(playlist)) == playlist
+    assert copy.deepcopy(playlist) == playlist
+
+
 @pytest.mark.vcr()
 def test_playlist_from_url():
     """
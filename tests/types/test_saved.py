@@ -0,0 +1,23 @@
+import copy
+import pickle
+
+from spotdl.types.saved import Saved
+
+
+def test_saved_init():
+    """
+    Test if Saved class is initialized correctly.
+    """
+
+    Saved(tracks=[])
+
+
+def test_saved_copy():
+    """
+    Test if Saved survives pickling and deep copying.
+    """
+
+    saved = Saved(tracks=[])
+
+    assert pickle.loads(pickle.dumps(saved)) == saved
+    assert copy.deepcopy(saved) == saved
@@ -1,4 +1,8 @@
-from spotdl.utils.providers import match_percentage
+from spotdl.utils.providers import (
+    best_result,
+    match_percentage,
+    total_match_percentage,
+)
 
 
 def test_match_percentage():
@@ -10,3 +14,29 @@ def test_match_percentage():
     assert match_percentage("test", "test", score_cutoff=0.5) == 100.0
     assert match_percentage("test", "test", score_cutoff=101.0) == 0.0
     assert match_percentage("test", "💩") == 0.0
+
+
+def test_total_match_percentage():
+    """
+    Test total_match_percentage function
+    """
+
+    assert total_match_percentage(["test", "test"], "test") == 200.0
+    assert total_match_percentage(["test", "abcd"], "test-song") == 100.0
+    assert total_match_percentage([], "test") == 0.0
+
+
+def test_best_result():
+    """
+    Test best_result function
+    """
+
+    assert best_result([]) is None
+    assert best_result([("a", 50.0), ("b", 70.0), ("c", 60.0)]) == ("b", 70.0)
+
+    def results():
+        yield "a", 50.0
+        yield "b", 96.0
+        raise AssertionError("results after the threshold shouldn't be scored")
+
+    assert best_result(results()) == ("b", 96.0)
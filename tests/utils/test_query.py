@@ -1,6 +1,7 @@
 import pytest
 
-from spotdl.utils.query import parse_query
+from spotdl.types.song import Song
+from spotdl.utils.query import deduplicate_songs, parse_query
 from spotdl.types.saved import SavedError
 
 
@@ -68,3 +69,42 @@ def test_parse_query():
     songs = parse_query(QUERY)
 
     assert len(songs) == 34
+
+
+def test_deduplicate_songs():
+    """
+    Test that duplicate songs are removed and order is kept.
+    """
+
+    song_dict = {
+        "name": "Ropes",
+        "artists": ["Dirty Palm", "Chandler Jewels"],
+        "album_name": "Ropes",
+        "album_artist": "Dirty Palm",
+        "genres": ["gaming edm", "melbourne bounce international"],
+        "disc_number": 1,
+        "duration": 188.0,
+        "year": "2021",
+        "date": "2021-10-28",
+        "track_number": 1,
+        "tracks_count": 1,
+        "isrc": "GB2LD2110301",
+        "song_id": "1t2qKa8K72IBC8yQlhD9bU",
+        "cover_url": "https://i.scdn.co/image/ab67616d0000b273fe2cb38e4d2412dbb0e54332",
+        "explicit": False,
+        "download_url": None,
+        "artist": "Dirty Palm",
+        "disc_count": 1,
+        "copyright": "",
+        "publisher": "",
+        "url": "https://open.spotify.com/track/1t2qKa8K72IBC8yQlhD9bU",
+    }
+
+    first = Song.from_dict(song_dict)
+    second = Song.from_dict(
+        {**song_dict, "url": "https://open.spotify.com/track/4B2kkxg3wKSTZw5JPaUtzQ"}
+    )
+
+    songs = deduplicate_songs([first, second, Song.from_dict(song_dict)])
+
+    assert songs == [first, second]
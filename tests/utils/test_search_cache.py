@@ -0,0 +1,84 @@
+import time
+import threading
+
+from spotdl.utils.search_cache import SearchCache
+
+
+def test_search_cache(tmp_path):
+    """
+    Test that search results are saved and loaded per provider.
+    """
+
+    cache = SearchCache(tmp_path / "search_cache.sqlite")
+
+    assert cache.get("https://open.spotify.com/track/1", "youtube-music") is None
+
+    cache.set("https://open.spotify.com/track/1", "youtube-music", "url1")
+
+    assert cache.get("https://open.spotify.com/track/1", "youtube-music") == "url1"
+    assert cache.get("https://open.spotify.com/track/1", "youtube") is None
+
+    cache.close()
+
+    # Results are persisted between instances
+    cache = SearchCache(tmp_path / "search_cache.sqlite")
+
+    assert cache.get("https://open.spotify.com/track/1", "youtube-music") == "url1"
+
+    cache.close()
+
+
+def test_search_cache_expired(tmp_path, monkeypatch):
+    """
+    Test that expired entries are not returned.
+    """
+
+    cache = SearchCache(tmp_path / "search_cache.sqlite", ttl=60)
+    cache.set("https://open.spotify.com/track/1", "youtube-music", "url1")
+
+    real_time = time.time()
+    monkeypatch.setattr(time, "time", lambda: real_time + 120)
+
+    assert cache.get("https://open.spotify.com/track/1", "youtube-music") is None
+
+    cache.close()
+
+
+def test_search_cache_threads(tmp_path):
+    """
+    Test that the cache can be used from other threads than the one
+    that created it.
+    """
+
+    cache = SearchCache(tmp_path / "search_cache.sqlite")
+    cache.set("https://open.spotify.com/track/1", "youtube-music", "url1")
+
+    results = []
+
+    def use_cache():
+        cache.set("https://open.spotify.com/track/2", "youtube-music", "url2")
+        results.append(cache.get("https://open.spotify.com/track/1", "youtube-music"))
+
+    thread = threading.Thread(target=use_cache)
+    thread.start()
+    thread.join()
+
+    assert results == ["url1"]
+    assert cache.get("https://open.spotify.com/track/2", "youtube-music") == "url2"
+
+    cache.close()
+
+
+def test_search_cache_lazy(tmp_path):
+    """
+    Test that the database is only created when the cache is used.
+    """
+
+    cache = SearchCache(tmp_path / "search_cache.sqlite")
+
+    assert not (tmp_path / "search_cache.sqlite").exists()
+
+    assert cache.get("https://open.spotify.com/track/1", "youtube-music") is None
+    assert (tmp_path / "search_cache.sqlite").exists()
+
+    cache.close()
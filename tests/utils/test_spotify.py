@@ -1,4 +1,4 @@
-from spotdl.utils.spotify import SpotifyClient, SpotifyError
+from spotdl.utils.spotify import SpotifyClient, SpotifyError, fetch_remaining_pages
 
 import pytest
 
@@ -34,3 +34,19 @@ def test_multiple_init():
             client_secret="client_secret",
             user_auth=False,
         )
+
+
+def test_fetch_remaining_pages():
+    """
+    Test that the pages after the first one are fetched in order.
+    """
+
+    first_page = {"items": [0, 1], "limit": 2, "offset": 0, "total": 7}
+
+    pages = fetch_remaining_pages(
+        first_page,
+        lambda offset: {"items": list(range(offset, min(offset + 2, 7)))},
+    )
+
+    assert [page["items"] for page in pages] == [[2, 3], [4, 5], [6]]
+    assert fetch_remaining_pages({**first_page, "total": 2}, lambda _: None) == []